@@ -1,9 +1,55 @@
 """
 import pygame es la librería principal para gráficos y manejo de eventos
 import os es para manejar rutas de archivos
+from operator import attrgetter es para resolver una sola vez los getters de atributos del courier
+from functools import lru_cache es para compartir las fuentes cargadas entre instancias
 """
 import pygame
 import os
+from operator import attrgetter
+from functools import lru_cache
+
+
+"""
+Helpers numéricos de la HUD a nivel de módulo (se llaman varias veces por frame)
+_mm_ss: Divide segundos en (minutos, segundos) enteros con un solo divmod
+_stamina_ratio: Devuelve (máximo entero >= 1, fracción de resistencia acotada a 0..1)
+_priority_level: Nivel de prioridad del job para el badge; Job guarda el dato tal como viene,
+así que un valor no numérico o nulo se muestra como 0
+"""
+def _mm_ss(secs):
+    m, s = divmod(secs, 60)
+    return int(m), int(s)
+
+_INF = float("inf")
+
+def _stamina_ratio(stamina, max_stamina):
+    max_sta = max(1, int(max_stamina))
+    r = stamina / max_sta
+    return max_sta, (0.0 if r < 0.0 else 1.0 if r > 1.0 else r)
+
+def _priority_level(job):
+    try:
+        return int(getattr(job, "priority", 0))
+    except (TypeError, ValueError):
+        return 0
+
+
+# Alineaciones de texto (enteros: se comparan/indexan más rápido que strings en cada blit)
+ALIGN_LEFT, ALIGN_CENTER, ALIGN_RIGHT = 0, 1, 2
+
+
+"""
+Carga una fuente TTF (o la fuente por defecto si falla) y la comparte entre instancias por (ruta, tamaño),
+así el archivo no se vuelve a parsear si se crean varias HUD
+"""
+@lru_cache(maxsize=16)
+def _load_font(path, size):
+    try:
+        return pygame.font.Font(path, size)
+    except Exception:
+        return pygame.font.Font(None, size)
+
 
 """
 La clase HUD gestiona la interfaz de usuario del juego, mostrando información relevante como
@@ -63,12 +109,69 @@ class HUD:
         # IA (CPU)
         self.ai_col = (255, 200, 150)
 
+        # Cache de líneas dinámicas: slot -> ((args, color), Surface)
+        # Evita formatear y rasterizar de nuevo si los valores no cambiaron
+        self._last = {}
+
+        # Despacho de alineación indexado por ALIGN_LEFT/ALIGN_CENTER/ALIGN_RIGHT
+        self._align_dispatch = (self._place_left, self._place_center, self._place_right)
+
+        # Accesos al courier resueltos una sola vez (ver _bind_courier)
+        self._courier_bound = None
+        self._get_delivered = None
+        self._get_max_stamina = None
+        self._get_reputation = None
+        self._has_jobs = None
+        self._get_current_job = None
+
+        # Accesos a la IA resueltos una sola vez (ver _bind_ai)
+        self._ai_bound = None
+        self._get_ai_max_stamina = None
+        self._get_ai_reputation = None
+        self._get_ai_income = None
+        self._get_ai_weight = None
+        self._get_ai_max_weight = None
+        self._get_ai_jobs = None
+
+        # Barras de resistencia (jugador / IA): Rects reutilizados, solo se mutan y/width por frame
+        self._bar_bg_rect = pygame.Rect(0, 0, 0, 20)
+        self._bar_fill_rect = pygame.Rect(0, 0, 0, 20)
+        self._bar_bg_rect_ai = pygame.Rect(0, 0, 0, 12)
+        self._bar_fill_rect_ai = pygame.Rect(0, 0, 0, 12)
+
+        # Línea divisoria preasignada; se reconstruye solo si cambia el ancho
+        self._div_surface = self._make_div(self.rect.width - 2*self.PAD)
+
+        # Fondo translúcido de la card, preasignado; se reconstruye solo si cambia el ancho
+        self._card_bg = self._make_card_bg(self.rect.width - 2*self.PAD)
+
+        # Panel compuesto del último frame y la tupla de estado con la que se dibujó (ver _frame_state)
+        self._panel = None
+        self._last_state = None
+
+        # Posiciones precalculadas del bloque superior, por (rect, con_ia) (ver _build_layout)
+        self._layouts = {}
+
         # Fuentes
         self.f_title = self._font(28)
         self.f = self._font(20)
         self.fs = self._font(16)
         self.fs_small = self._font(14)
 
+        # Interlineado de self.f (constante); el del footer ya se resuelve una vez por geometría
+        self._lh_f = self.f.get_linesize()
+
+        # Badges de prioridad precalculados, colores suaves por nivel (0 bajo, 1 medio, 2 alto)
+        self._badges = {
+            0: self._make_badge("PRIO 0", (180, 220, 255)),
+            1: self._make_badge("PRIO 1", (255, 200, 120)),
+            2: self._make_badge("PRIO 2", (255, 120, 120)),
+        }
+
+        # Mensajes contextuales del footer (solo hay dos): se renderizan una vez
+        self._ctx_pickup = self.f.render("🟡 Presiona ESPACIO para recoger", True, self.hl)
+        self._ctx_dropoff = self.f.render("🟢 Presiona E para entregar", True, self.ok)
+
         # Footer
         self.controls = [
             "Flechas: Moverse",
@@ -88,6 +191,19 @@ class HUD:
             "Ctrl+L: Cargar",
         ]
 
+        # Pares (Surface, pos) del footer por geometría (ver _build_footer_blits)
+        self._footer_blits = {}
+
+        # Caché de textos constantes (título, encabezados, footer): (id(fuente), texto, color) -> Surface
+        self._text_cache = {}
+        for f_body in (self.fs, self.fs_small):
+            for t in self.controls + self.system:
+                self._render(t, f_body, self.subtx)
+            for t in self.sorting + ["--- Ordenar ---"]:
+                self._render(t, f_body, self.sortc)
+            for t in ("--- Sistema ---", "--- Controles ---"):
+                self._render(t, f_body, self.hint)
+
     """
     Métodos de ayuda para renderizar texto, divisores, tarjetas de pedidos, y manejar la dificultad IA
     ---------Parameters---------
@@ -103,56 +219,231 @@ class HUD:
         Coordenada X donde se dibuja el texto
     y : int
         Coordenada Y donde se dibuja el texto
-    align : str, optional
-        Alineación del texto ("left", "center", "right"), por defecto "left
+    align : int, optional
+        Alineación del texto (ALIGN_LEFT, ALIGN_CENTER, ALIGN_RIGHT), por defecto ALIGN_LEFT
     ---------Returns---------
-        _blit: Dibuja el texto en la superficie dada y devuelve la altura del texto renderizado
+        _render: Devuelve la Surface de un texto constante, renderizándola solo la primera vez
+        _blit_fmt: Dibuja plantilla + valores con la alineación dada y devuelve la altura, reutilizando la Surface si los valores no cambiaron
+        _blit_left: Dibuja un texto constante alineado a la izquierda y devuelve la altura del texto renderizado
+        _place_left/_place_center/_place_right: Posicionan una Surface ya renderizada y devuelven su altura (despacho de alineación)
+        _draw_bar: Dibuja una barra de resistencia reutilizando Rects preasignados y devuelve su borde inferior
         _div: Dibuja una línea divisoria en la superficie dada y devuelve su altura 
-        _fmt_secs: Formatea segundos como cadena MM:SS
+        _make_div: Crea la Surface de la línea divisoria para un ancho dado
         _draw_priority_badge: Dibuja una insignia de prioridad en la superficie dada y devuelve su altura
+        _make_badge: Construye una vez la Surface de un badge de prioridad
         _draw_footer: Dibuja el pie de página con controles y sistema en la superficie dada y devuelve la coordenada Y final
         _footer_with_autofit: Dibuja el pie de página adaptándose al espacio disponible y devuelve la coordenada Y final
         _draw_job_card: Dibuja una tarjeta de pedido en la superficie dada y devuelve la coordenada Y final
         _difficulty_label_and_color: Devuelve el texto y color para la dificultad de la IA
     """
     def _font(self, size):
-        try:
-            return pygame.font.Font(os.path.join("fonts", "RussoOne-Regular.ttf"), size)
-        except Exception:
-            return pygame.font.Font(None, size)
-
-    def _blit(self, surf, text, font, col, x, y, align="left"):
-        s = font.render(text, True, col)
-        r = s.get_rect()
-        if align == "left":
-            r.topleft = (x, y)
-        elif align == "center":
-            r.midtop = (x, y)
-        elif align == "right":
-            r.topright = (x, y)
-        surf.blit(s, r)
-        return r.height
+        return _load_font(os.path.join("fonts", "RussoOne-Regular.ttf"), size)
+
+    def _render(self, text, font, col):
+        # Textos constantes: se rasterizan una vez por (fuente, texto, color)
+        key = (id(font), text, col)
+        s = self._text_cache.get(key)
+        if s is None:
+            s = self._text_cache[key] = font.render(text, True, col)
+        return s
+
+    # Variante especializada para los sitios alineados a la izquierda (sin despacho por llamada)
+    def _blit_left(self, surf, text, font, col, x, y):
+        s = self._render(text, font, col)
+        surf.blit(s, (x, y))
+        return s.get_height()
+
+    def _blit_fmt(self, surf, slot, fmt, args, font, col, x, y, align=ALIGN_LEFT):
+        # Solo formatea y renderiza cuando cambian los valores (ya cuantizados) o el color.
+        # El render se queda en el hilo principal: los pygame.font.Font no son thread-safe y con
+        # esta caché solo se rasterizan unas pocas líneas por segundo, no hay latencia que ocultar.
+        key = (args, col)
+        last = self._last.get(slot)
+        if last is None or last[0] != key:
+            last = (key, font.render(fmt.format(*args), True, col))
+            self._last[slot] = last
+        return self._align_dispatch[align](surf, last[1], x, y)
+
+    def _place_left(self, surf, s, x, y):
+        surf.blit(s, (x, y))
+        return s.get_height()
+
+    def _place_center(self, surf, s, x, y):
+        surf.blit(s, (x - s.get_width() // 2, y))
+        return s.get_height()
+
+    def _place_right(self, surf, s, x, y):
+        surf.blit(s, (x - s.get_width(), y))
+        return s.get_height()
 
-    def _div(self, surf, y):
-        line = pygame.Surface((self.rect.width - 2*self.PAD, 1), pygame.SRCALPHA)
-        line.fill((255, 255, 255, self.DIV_ALPHA))
-        surf.blit(line, (self.rect.left + self.PAD, y))
-        return 1
+    """
+    Resuelve una sola vez qué atributos y métodos expone el courier, para no usar getattr/hasattr en cada frame
+    ---------Parameters---------
+    courier : Any
+        Objeto courier que se va a dibujar
+    ---------Returns---------
+        _bind_courier: Guarda getters y métodos enlazados del courier en la instancia
+    """
+    def _bind_courier(self, courier):
+        self._courier_bound = courier
+        if hasattr(courier, "packages_delivered"):
+            self._get_delivered = attrgetter("packages_delivered")
+        elif hasattr(courier, "delivered_count"):
+            self._get_delivered = attrgetter("delivered_count")
+        else:
+            self._get_delivered = lambda c: 0
+        self._get_max_stamina = attrgetter("max_stamina") if hasattr(courier, "max_stamina") else (lambda c: 100)
+        self._get_reputation = attrgetter("reputation") if hasattr(courier, "reputation") else (lambda c: 70)
+        self._has_jobs = getattr(courier, "has_jobs", None)
+        self._get_current_job = getattr(courier, "get_current_job", None)
+
+    """
+    Dibuja una barra de resistencia reutilizando los Rects dados (sin crear objetos nuevos)
+    ---------Parameters---------
+    surf : pygame.Surface
+        Superficie donde se dibuja la barra
+    bg_rect : pygame.Rect
+        Rect de fondo de la barra (se mutan x, y, width)
+    fill_rect : pygame.Rect
+        Rect del relleno de la barra (se mutan x, y, width)
+    x : int
+        Coordenada X de la barra
+    y : int
+        Coordenada Y de la barra
+    w : int
+        Ancho total de la barra
+    pct : float
+        Fracción de resistencia (0..1)
+    ---------Returns---------
+        _draw_bar: Devuelve la coordenada Y inferior de la barra
+    """
+    def _draw_bar(self, surf, bg_rect, fill_rect, x, y, w, pct):
+        bg_rect.x = fill_rect.x = x
+        bg_rect.y = fill_rect.y = y
+        bg_rect.width = w
+        fill_rect.width = int(w * pct)
+        pygame.draw.rect(surf, (50, 50, 50), bg_rect)
+        pygame.draw.rect(surf, self.warn if pct < 0.3 else self.ok, fill_rect)
+        return bg_rect.bottom
 
-    # --------- helper para formatear segs ---------
     """
-    Formatea segundos como cadena MM:SS
+    Calcula una sola vez las posiciones Y del bloque superior de la HUD (título, jugador, IA, inventario, clima)
+    Las alturas se miden con font.size sobre textos representativos, que coincide con la altura del render
     ---------Parameters---------
-    secs : float
-        Segundos a formatear
+    with_ai : bool
+        Si se reserva espacio para la sección de la IA
     ---------Returns---------
-        _fmt_secs: Devuelve una cadena formateada como MM:SS
+        _layout_for: Devuelve un dict nombre -> coordenada; se recalcula solo si cambia self.rect
+        _build_layout: Simula la secuencia de dibujo y devuelve el dict de posiciones
     """
-    def _fmt_secs(self, secs: float) -> str:
-        secs = max(0, int(secs))
-        m = secs // 60
-        s = secs % 60
-        return f"{m:02d}:{s:02d}"
+    def _layout_for(self, with_ai):
+        key = (tuple(self.rect), with_ai)
+        layout = self._layouts.get(key)
+        if layout is None:
+            layout = self._layouts[key] = self._build_layout(with_ai)
+        return layout
+
+    def _build_layout(self, with_ai):
+        def h(font, text):
+            return font.size(text)[1]
+
+        pad = self.PAD
+        content_w = self.rect.width - 2*pad
+        L = {"x": self.rect.left + pad, "w": content_w, "cx": self.rect.left + pad + content_w//2}
+        y = self.rect.top + pad
+
+        L["title"] = y
+        y += h(self.f_title, "COURIER QUEST") + self.SEC_GAP
+        L["time"] = y
+        y += h(self.f, "Tiempo: 00:00") + self.VR_GAP
+        L["income"] = y
+        y += h(self.f, "Ingresos: $0.0/0")
+        L["div_time"] = y
+        y += self.SEC_GAP + 1
+
+        y += self.SEC_GAP
+        L["player_hdr"] = y
+        y += h(self.fs, "--- Repartidor (Jugador) ---") + self.VR_GAP
+        L["pos"] = y
+        y += h(self.fs, "Posición: (0, 0)")
+        L["delivered"] = y
+        y += h(self.fs, "Entregados: 0")
+        L["bar"] = y + self.VR_GAP
+        y = L["bar"] + self._bar_bg_rect.height + 4
+        L["stamina"] = y
+        y += h(self.fs, "Resistencia: 0/0")
+        L["div_player"] = y
+        y += self.SEC_GAP + 1
+
+        y += self.SEC_GAP
+        L["rep"] = y
+        y += h(self.f, "Reputación: 0")
+        L["div_rep"] = y
+        y += self.SEC_GAP + 1
+
+        if with_ai:
+            y += self.SEC_GAP
+            L["ai_hdr"] = y
+            y += h(self.fs, "--- IA (CPU) ---") + self.VR_GAP
+            L["ai_diff"] = y
+            y += h(self.fs, "Dificultad IA: " + self._difficulty_label_and_color()[0]) + self.VR_GAP
+            L["ai_pos"] = y
+            y += h(self.fs, "Pos IA: (0, 0)")
+            L["ai_weight"] = y
+            y += h(self.fs, "Peso IA: 0.0/0 kg")
+            L["ai_jobs"] = y
+            y += h(self.fs, "IA pedidos activos: 0")
+            L["ai_bar"] = y + self.VR_GAP
+            y = L["ai_bar"] + self._bar_bg_rect_ai.height + 2
+            L["ai_stamina"] = y
+            y += h(self.fs_small, "IA Resistencia: 0/0") + self.SEC_GAP
+            L["ai_rep"] = y
+            y += h(self.fs, "IA Reputación: 0") + self.VR_GAP
+            L["compare"] = y
+            y += h(self.fs, "Jugador: $0.0 vs IA: $0.0")
+            L["div_ai"] = y
+            y += self.SEC_GAP + 1
+
+        y += self.SEC_GAP
+        L["inv_hdr"] = y
+        y += h(self.fs, "--- Inventario ---")
+        L["inv_msg"] = y
+        y += h(self.fs, "Tienes pedidos activos")
+        L["div_inv"] = y
+        y += self.SEC_GAP + 1
+
+        y += self.SEC_GAP
+        L["weather_hdr"] = y
+        y += h(self.fs, "--- Clima ---") + self.VR_GAP
+        L["weather"] = y
+        y += h(self.fs, "Condición: ")
+        L["speed"] = y
+        y += h(self.fs, "Velocidad: 100%")
+        L["end"] = y
+
+        # Título y encabezados fijos del bloque superior, listos para un solo blits()
+        title = self._render("COURIER QUEST", self.f_title, self.hl)
+        L["static_blits"] = [
+            (title, (self.rect.centerx - title.get_width() // 2, L["title"])),
+            (self._render("--- Repartidor (Jugador) ---", self.fs, self.player_col), (L["x"], L["player_hdr"])),
+            (self._render("--- Inventario ---", self.fs, self.tx), (L["x"], L["inv_hdr"])),
+            (self._render("--- Clima ---", self.fs, self.tx), (L["x"], L["weather_hdr"])),
+        ]
+        if with_ai:
+            L["static_blits"].append((self._render("--- IA (CPU) ---", self.fs, self.ai_col), (L["x"], L["ai_hdr"])))
+        return L
+
+    def _div(self, surf, y):
+        w = self.rect.width - 2*self.PAD
+        if self._div_surface.get_width() != w:
+            self._div_surface = self._make_div(w)
+        surf.blit(self._div_surface, (self.rect.left + self.PAD, y))
+        return 1
+
+    def _make_div(self, w):
+        line = pygame.Surface((w, 1), pygame.SRCALPHA)
+        line.fill((255, 255, 255, self.DIV_ALPHA))
+        return line
 
     # --------- badge de prioridad en la card ---------
     """
@@ -167,20 +458,16 @@ class HUD:
     level : int
         Nivel de prioridad (0 bajo, 1 medio, 2 alto)
     ---------Returns---------   
-        _draw_priority_badge: Dibuja la insignia y devuelve su altura
+        _draw_priority_badge: Dibuja la insignia precalculada y devuelve su altura
+        _make_badge: Renderiza texto + fondo redondeado de un badge en una Surface reutilizable
     """
     def _draw_priority_badge(self, screen, x, y, level: int):
-        # colores suaves por nivel (0 bajo, 1 medio, 2 alto)
-        if level >= 2:
-            col = (255, 120, 120)   # alto
-            txt = "PRIO 2"
-        elif level == 1:
-            col = (255, 200, 120)   # medio
-            txt = "PRIO 1"
-        else:
-            col = (180, 220, 255)   # bajo
-            txt = "PRIO 0"
+        # Solo hay 3 badges posibles: se precalculan en __init__ (ver _make_badge)
+        badge = self._badges[2 if level >= 2 else 1 if level == 1 else 0]
+        screen.blit(badge, (x, y))
+        return badge.get_height()
 
+    def _make_badge(self, txt, col):
         pad_h = 4
         pad_w = 8
         s = self.fs.render(txt, True, (0, 0, 0))
@@ -188,8 +475,7 @@ class HUD:
         badge = pygame.Surface((w, h), pygame.SRCALPHA)
         pygame.draw.rect(badge, col + (180,), pygame.Rect(0, 0, w, h), border_radius=8)
         badge.blit(s, (pad_w, pad_h))
-        screen.blit(badge, (x, y))
-        return h
+        return badge
 
     """
     Dibuja el pie de página con controles y sistema en la superficie dada y devuelve la coordenada Y final
@@ -200,8 +486,8 @@ class HUD:
         Coordenada X donde se dibuja el pie de página
     bottom : int    
         Coordenada Y inferior donde se dibuja el pie de página
-    contextual : Optional[str]  
-        Mensaje contextual opcional para mostrar en el pie de página
+    contextual : Optional[pygame.Surface]
+        Mensaje contextual opcional ya renderizado para mostrar en el pie de página
     f_body : pygame.font.Font   
         Fuente a utilizar para el cuerpo del pie de página
     gap_line : int
@@ -210,39 +496,62 @@ class HUD:
         Espacio entre secciones en el pie de página
     ---------Returns---------   
         _draw_footer: Devuelve la coordenada Y final después de dibujar el pie de página
+        _footer_layout: Igual que _build_footer_blits pero cacheado por geometría
+        _footer_top: Devuelve la coordenada Y final que tendría el pie de página, sin dibujarlo
+        _build_footer_blits: Devuelve (pares (Surface, pos) de las líneas fijas, Y superior) para una geometría dada
     """
     def _draw_footer(self, screen, x, bottom, contextual, f_body, gap_line, sec_gap):
+        # Las líneas fijas del footer se posicionan una vez por geometría y se dibujan en un solo blits()
+        pairs, y = self._footer_layout(x, bottom, f_body, gap_line, sec_gap)
+        screen.blits(pairs, doreturn=False)
+
+        # Mensaje contextual
+        if contextual is not None:
+            y -= (self._lh_f + 10)
+            self._place_left(screen, contextual, x, y)
+
+        return y
+
+    def _footer_layout(self, x, bottom, f_body, gap_line, sec_gap):
+        key = (id(f_body), x, bottom, gap_line, sec_gap)
+        cached = self._footer_blits.get(key)
+        if cached is None:
+            cached = self._footer_blits[key] = self._build_footer_blits(x, bottom, f_body, gap_line, sec_gap)
+        return cached
+
+    def _footer_top(self, x, bottom, contextual, f_body, gap_line, sec_gap):
+        y = self._footer_layout(x, bottom, f_body, gap_line, sec_gap)[1]
+        if contextual is not None:
+            y -= (self._lh_f + 10)
+        return y
+
+    def _build_footer_blits(self, x, bottom, f_body, gap_line, sec_gap):
         lh = f_body.get_linesize()
         y = bottom
+        pairs = []
 
         # Sistema
         for t in reversed(self.system):
             y -= (lh - gap_line)
-            self._blit(screen, t, f_body, self.subtx, x, y)
+            pairs.append((self._render(t, f_body, self.subtx), (x, y)))
         y -= sec_gap + lh
-        self._blit(screen, "--- Sistema ---", f_body, self.hint, x, y)
+        pairs.append((self._render("--- Sistema ---", f_body, self.hint), (x, y)))
 
         # Ordenar
         for t in reversed(self.sorting):
             y -= (lh - gap_line)
-            self._blit(screen, t, f_body, self.sortc, x, y)
+            pairs.append((self._render(t, f_body, self.sortc), (x, y)))
         y -= sec_gap + lh
-        self._blit(screen, "--- Ordenar ---", f_body, self.sortc, x, y)
+        pairs.append((self._render("--- Ordenar ---", f_body, self.sortc), (x, y)))
 
         # Controles
         for t in reversed(self.controls):
             y -= (lh - gap_line)
-            self._blit(screen, t, f_body, self.subtx, x, y)
+            pairs.append((self._render(t, f_body, self.subtx), (x, y)))
         y -= sec_gap + lh
-        self._blit(screen, "--- Controles ---", f_body, self.hint, x, y)
+        pairs.append((self._render("--- Controles ---", f_body, self.hint), (x, y)))
 
-        # Mensaje contextual
-        if contextual:
-            y -= (self.f.get_linesize() + 10)
-            color = self.hl if "ESPACIO" in contextual else self.ok
-            self._blit(screen, contextual, self.f, color, x, y)
-
-        return y
+        return pairs, y
 
     """
     Dibuja el pie de página adaptándose al espacio disponible y devuelve la coordenada Y final
@@ -255,26 +564,24 @@ class HUD:
         Coordenada Y inferior donde se dibuja el pie de página     
     top_limit : int
         Límite superior para evitar sobreposición con contenido principal
-    contextual : Optional[str]  
-        Mensaje contextual opcional para mostrar en el pie de página
+    contextual : Optional[pygame.Surface]
+        Mensaje contextual opcional ya renderizado para mostrar en el pie de página
     ---------Returns---------
         _footer_with_autofit: Devuelve la coordenada Y final después de dibujar el pie de página
     """
     def _footer_with_autofit(self, screen, x, bottom, top_limit, contextual):
         min_gap = 12
-        top = self._draw_footer(
-            screen, x, bottom, contextual, self.fs,
-            self.FOOTER_GAP_LINE, self.FOOTER_SEC_GAP
-        )
-        if top < top_limit + min_gap:
-            pygame.draw.rect(screen, self.bg,
-                             pygame.Rect(self.rect.left, max(top, top_limit),
-                                         self.rect.width, bottom - max(top, top_limit)))
-            top = self._draw_footer(
-                screen, x, bottom, contextual, self.fs_small,
-                self.FOOTER_GAP_LINE_COMPACT, self.FOOTER_SEC_GAP_COMPACT
+        # Se mide primero (sin dibujar) y se dibuja una sola vez con la fuente que cabe
+        if self._footer_top(x, bottom, contextual, self.fs,
+                            self.FOOTER_GAP_LINE, self.FOOTER_SEC_GAP) >= top_limit + min_gap:
+            return self._draw_footer(
+                screen, x, bottom, contextual, self.fs,
+                self.FOOTER_GAP_LINE, self.FOOTER_SEC_GAP
             )
-        return top
+        return self._draw_footer(
+            screen, x, bottom, contextual, self.fs_small,
+            self.FOOTER_GAP_LINE_COMPACT, self.FOOTER_SEC_GAP_COMPACT
+        )
 
     """
     Dibuja una tarjeta de pedido en la superficie dada y devuelve la coordenada Y final
@@ -288,53 +595,54 @@ class HUD:
     w : int
         Ancho de la tarjeta
     job : Any
-        Objeto de pedido con atributos id, payout, priority y método get_time_until_deadline
-    current_game_time : Optional[float], optional
-        Tiempo actual del juego para calcular el tiempo restante, por defecto None
+        Objeto de pedido con atributos id, payout y priority
+    time_left : Optional[float], optional
+        Segundos restantes hasta el deadline (ver _card_time_left); None si no se muestra
     ---------Returns---------   
         _draw_job_card: Devuelve la coordenada Y final después de dibujar la tarjeta de pedido
+        _make_card_bg: Crea la Surface translúcida de fondo de la tarjeta para un ancho dado
     """
-    def _draw_job_card(self, screen, x, y, w, job, current_game_time=None):
+    def _draw_job_card(self, screen, x, y, w, job, time_left=None):
         card_h = self.CARD_H_MIN
-        card_rect = pygame.Rect(x, y, w, card_h)
-        s = pygame.Surface((w, card_h), pygame.SRCALPHA)
-        s.fill(self.CARD_BG)
-        screen.blit(s, (x, y))
+        if self._card_bg.get_width() != w:
+            self._card_bg = self._make_card_bg(w)
+        screen.blit(self._card_bg, (x, y))
 
         yy = y + self.CARD_PAD
-        yy += self._blit(screen, "PEDIDO ACTUAL:", self.f, self.hl, x + self.CARD_PAD, yy)
+        yy += self._blit_left(screen, "PEDIDO ACTUAL:", self.f, self.hl, x + self.CARD_PAD, yy)
         # Badge de prioridad alineado a la derecha
-        try:
-            prio = int(getattr(job, "priority", 0))
-        except Exception:
-            prio = 0
         self._draw_priority_badge(
             screen,
             x + w - self.CARD_PAD - 92,
-            yy - self.f.get_linesize() + 2,
-            prio
+            yy - self._lh_f + 2,
+            _priority_level(job)
         )
 
-        yy += self._blit(screen, f"ID: {job.id}", self.f, self.tx, x + self.CARD_PAD, yy)
-        yy += self._blit(screen, f"Pago: ${job.payout:.1f}", self.f, self.tx, x + self.CARD_PAD, yy)
+        yy += self._blit_fmt(screen, "card_id", "ID: {}", (job.id,), self.f, self.tx, x + self.CARD_PAD, yy)
+        yy += self._blit_fmt(
+            screen, "card_pay", "Pago: ${:.1f}", (round(job.payout, 1),), self.f, self.tx, x + self.CARD_PAD, yy
+        )
 
         # Tiempo restante
-        if current_game_time is not None and hasattr(job, "get_time_until_deadline"):
-            try:
-                tl = float(job.get_time_until_deadline(current_game_time))
-                tcol = self.warn if tl <= 0 else (self.hl if tl < 60 else self.tx)
-                yy += self._blit(
-                    screen,
-                    f"Tiempo restante: {self._fmt_secs(tl)}",
-                    self.f,
-                    tcol,
-                    x + self.CARD_PAD,
-                    yy
-                )
-            except Exception:
-                pass
-
-        return card_rect.bottom
+        if time_left is not None:
+            tcol = self.warn if time_left <= 0 else (self.hl if time_left < 60 else self.tx)
+            yy += self._blit_fmt(
+                screen,
+                "card_time",
+                "Tiempo restante: {:02d}:{:02d}",
+                _mm_ss(max(0, int(time_left))),
+                self.f,
+                tcol,
+                x + self.CARD_PAD,
+                yy
+            )
+
+        return y + card_h
+
+    def _make_card_bg(self, w):
+        bg = pygame.Surface((w, self.CARD_H_MIN), pygame.SRCALPHA)
+        bg.fill(self.CARD_BG)
+        return bg
 
     # --------- Dificultad IA: label y color ---------
     """
@@ -401,213 +709,255 @@ class HUD:
     def draw(self, screen, courier, weather_condition, speed_multiplier,
              remaining_time=0, goal_income=0, near_pickup=False, near_dropoff=False,
              current_game_time=None, ai_courier=None):
-        pygame.draw.rect(screen, self.bg, self.rect)
-        pad = self.PAD
-        x = self.rect.left + pad
-        y = self.rect.top + pad
-        content_w = self.rect.width - 2*pad
+        if courier is not self._courier_bound:
+            self._bind_courier(courier)
+        has_jobs = self._has_jobs is not None and self._has_jobs()
+        job = self._get_current_job() if has_jobs and self._get_current_job is not None else None
+        L = self._layout_for(ai_courier is not None)
+        x = L["x"]
+        content_w = L["w"]
+        max_sta, sta_pct = _stamina_ratio(courier.stamina, self._get_max_stamina(courier))
+        card_tl = self._card_time_left(job, current_game_time)
+        ai_vals = self._ai_values(ai_courier) if ai_courier is not None else None
+
+        # Si nada visible cambió desde el último frame, se reutiliza el panel ya compuesto
+        state = self._frame_state(
+            courier, weather_condition, speed_multiplier, remaining_time, goal_income,
+            near_pickup, near_dropoff, has_jobs, job, card_tl, ai_vals, max_sta, sta_pct, content_w
+        )
+        if state == self._last_state and self._panel is not None:
+            screen.blit(self._panel, self.rect)
+            return
+        self._last_state = state
 
-        # --- Título ---
-        y += self._blit(
-            screen,
-            "COURIER QUEST",
-            self.f_title,
-            self.hl,
-            self.rect.centerx,
-            y,
-            align="center"
-        ) + self.SEC_GAP
+        # Referencias locales a las funciones que se llaman muchas veces en el resto del frame
+        blit_fmt = self._blit_fmt
+        blit_left = self._blit_left
+        div = self._div
+        draw_rect = pygame.draw.rect
+
+        draw_rect(screen, self.bg, self.rect)
+
+        # --- Título y encabezados fijos ---
+        screen.blits(L["static_blits"], doreturn=False)
 
         # Tiempo / Ingresos
-        minutes = int(remaining_time // 60)
-        seconds = int(remaining_time % 60)
+        minutes, seconds = _mm_ss(remaining_time)
         tcol = self.warn if remaining_time < 60 else self.tx
-        y += self._blit(screen, f"Tiempo: {minutes:02d}:{seconds:02d}", self.f, tcol, x, y) + self.VR_GAP
+        blit_fmt(screen, "time", "Tiempo: {:02d}:{:02d}", (minutes, seconds), self.f, tcol, x, L["time"])
         icol = self.ok if courier.income >= goal_income else self.tx
-        y += self._blit(
+        blit_fmt(
             screen,
-            f"Ingresos: ${courier.income:.1f}/{int(goal_income)}",
+            "income",
+            "Ingresos: ${:.1f}/{}",
+            (round(courier.income, 1), int(goal_income)),
             self.f,
             icol,
             x,
-            y
+            L["income"]
         )
-        y += self.SEC_GAP + self._div(screen, y)
+        div(screen, L["div_time"])
 
         # --- Repartidor (jugador humano) ---
-        y += self.SEC_GAP
-        y += self._blit(screen, "--- Repartidor (Jugador) ---", self.fs, self.player_col, x, y)
-        y += self.VR_GAP
-        y += self._blit(screen, f"Posición: ({courier.x}, {courier.y})", self.fs, self.tx, x, y)
-        delivered = getattr(courier, "packages_delivered", getattr(courier, "delivered_count", 0))
-        y += self._blit(screen, f"Entregados: {delivered}", self.fs, self.tx, x, y)
+        blit_fmt(screen, "pos", "Posición: ({}, {})", (courier.x, courier.y), self.fs, self.tx, x, L["pos"])
+        delivered = self._get_delivered(courier)
+        blit_fmt(screen, "delivered", "Entregados: {}", (delivered,), self.fs, self.tx, x, L["delivered"])
 
         # Resistencia
-        max_sta = max(1, int(getattr(courier, "max_stamina", 100)))
-        sta_pct = max(0.0, min(1.0, courier.stamina / max_sta))
-        bar_h = 20
-        bar_rect = pygame.Rect(x, y + self.VR_GAP, content_w, bar_h)
-        pygame.draw.rect(screen, (50, 50, 50), bar_rect)
-        fill_rect = pygame.Rect(x, y + self.VR_GAP, int(content_w * sta_pct), bar_h)
-        pygame.draw.rect(screen, self.warn if sta_pct < 0.3 else self.ok, fill_rect)
-        y = bar_rect.bottom + 4
-        y += self._blit(
+        self._draw_bar(screen, self._bar_bg_rect, self._bar_fill_rect, x, L["bar"], content_w, sta_pct)
+        blit_fmt(
             screen,
-            f"Resistencia: {int(courier.stamina)}/{max_sta}",
+            "stamina",
+            "Resistencia: {}/{}",
+            (int(courier.stamina), max_sta),
             self.fs,
             self.tx,
-            x + content_w//2,
-            y,
-            align="center"
+            L["cx"],
+            L["stamina"],
+            align=ALIGN_CENTER
         )
-        y += self.SEC_GAP + self._div(screen, y)
+        div(screen, L["div_player"])
 
         # Reputación
-        y += self.SEC_GAP
-        rep = int(getattr(courier, "reputation", 70))
+        rep = int(self._get_reputation(courier))
         rcol = self.ok if rep >= 90 else self.warn if rep < 30 else self.tx
-        y += self._blit(screen, f"Reputación: {rep}", self.f, rcol, x, y)
-        y += self.SEC_GAP + self._div(screen, y)
+        blit_fmt(screen, "rep", "Reputación: {}", (rep,), self.f, rcol, x, L["rep"])
+        div(screen, L["div_rep"])
 
         # --- IA (CPU) status (opcional) ---
         if ai_courier is not None:
-            y += self.SEC_GAP
-            # Encabezado IA con color propio
-            y += self._blit(screen, "--- IA (CPU) ---", self.fs, self.ai_col, x, y)
-            y += self.VR_GAP
+            ai_x, ai_y, current_w_ai, max_w_ai, active_jobs_ai, ai_sta, max_sta_ai, sta_pct_ai, rep_ai, ai_inc = ai_vals
 
             # Línea de dificultad IA
             diff_label, diff_col = self._difficulty_label_and_color()
-            y += self._blit(
-                screen,
-                f"Dificultad IA: {diff_label}",
-                self.fs,
-                diff_col,
-                x,
-                y
-            )
-            y += self.VR_GAP
+            blit_fmt(screen, "ai_diff", "Dificultad IA: {}", (diff_label,), self.fs, diff_col, x, L["ai_diff"])
 
             # Posición de la IA
-            y += self._blit(screen, f"Pos IA: ({ai_courier.x}, {ai_courier.y})", self.fs, self.tx, x, y)
+            blit_fmt(screen, "ai_pos", "Pos IA: ({}, {})", (ai_x, ai_y), self.fs, self.tx, x, L["ai_pos"])
 
             # Peso y pedidos activos de la IA
-            inv_ai = getattr(ai_courier, "inventory", None)
-            current_w_ai = getattr(inv_ai, "current_weight", 0.0) if inv_ai else 0.0
-            max_w_ai = getattr(inv_ai, "max_weight", getattr(ai_courier, "max_weight_ia", 0))
-            y += self._blit(
+            blit_fmt(
                 screen,
-                f"Peso IA: {current_w_ai:.1f}/{max_w_ai} kg",
+                "ai_weight",
+                "Peso IA: {:.1f}/{} kg",
+                (current_w_ai, max_w_ai),
                 self.fs,
                 self.tx,
                 x,
-                y
+                L["ai_weight"]
             )
-
-            active_jobs_ai = 0
-            if inv_ai is not None:
-                if hasattr(inv_ai, "get_job_count"):
-                    active_jobs_ai = inv_ai.get_job_count()
-                elif hasattr(inv_ai, "jobs"):
-                    active_jobs_ai = len(inv_ai.jobs)
-            y += self._blit(
-                screen,
-                f"IA pedidos activos: {active_jobs_ai}",
-                self.fs,
-                self.tx,
-                x,
-                y
+            blit_fmt(
+                screen, "ai_jobs", "IA pedidos activos: {}", (active_jobs_ai,), self.fs, self.tx, x, L["ai_jobs"]
             )
 
             # Barra de resistencia de la IA
-            max_sta_ai = max(1, int(getattr(ai_courier, "max_stamina", 100)))
-            sta_pct_ai = max(0.0, min(1.0, ai_courier.stamina / max_sta_ai))
-            bar_h_ai = 12
-            bar_rect_ai = pygame.Rect(x, y + self.VR_GAP, content_w, bar_h_ai)
-            pygame.draw.rect(screen, (50, 50, 50), bar_rect_ai)
-            fill_rect_ai = pygame.Rect(x, y + self.VR_GAP, int(content_w * sta_pct_ai), bar_h_ai)
-            pygame.draw.rect(screen, self.warn if sta_pct_ai < 0.3 else self.ok, fill_rect_ai)
-            y = bar_rect_ai.bottom + 2
-            y += self._blit(
+            self._draw_bar(screen, self._bar_bg_rect_ai, self._bar_fill_rect_ai, x, L["ai_bar"], content_w, sta_pct_ai)
+            blit_fmt(
                 screen,
-                f"IA Resistencia: {int(ai_courier.stamina)}/{max_sta_ai}",
+                "ai_stamina",
+                "IA Resistencia: {}/{}",
+                (ai_sta, max_sta_ai),
                 self.fs_small,
                 self.tx,
-                x + content_w // 2,
-                y,
-                align="center"
+                L["cx"],
+                L["ai_stamina"],
+                align=ALIGN_CENTER
             )
 
             # Reputación IA
-            y += self.SEC_GAP
-            rep_ai = int(getattr(ai_courier, "reputation", 70))
             rcol_ai = self.ok if rep_ai >= 90 else self.warn if rep_ai < 30 else self.tx
-            y += self._blit(screen, f"IA Reputación: {rep_ai}", self.fs, rcol_ai, x, y)
+            blit_fmt(screen, "ai_rep", "IA Reputación: {}", (rep_ai,), self.fs, rcol_ai, x, L["ai_rep"])
 
             # Comparación de ingresos Jugador vs IA
-            y += self.VR_GAP
-            player_inc = getattr(courier, "income", 0.0)
-            ai_inc = getattr(ai_courier, "income", 0.0)
-            comp_col = self.ok if player_inc >= ai_inc else self.warn
-            y += self._blit(
+            player_inc = round(courier.income, 1)
+            comp_col = self.ok if courier.income >= ai_inc else self.warn
+            blit_fmt(
                 screen,
-                f"Jugador: ${player_inc:.1f} vs IA: ${ai_inc:.1f}",
+                "compare",
+                "Jugador: ${:.1f} vs IA: ${:.1f}",
+                (player_inc, round(ai_inc, 1)),
                 self.fs,
                 comp_col,
                 x,
-                y
+                L["compare"]
             )
-
-            y += self.SEC_GAP + self._div(screen, y)
+            div(screen, L["div_ai"])
 
         # Inventario (solo mensaje)
-        y += self.SEC_GAP
-        y += self._blit(screen, "--- Inventario ---", self.fs, self.tx, x, y)
-        if hasattr(courier, "has_jobs") and courier.has_jobs():
-            y += self._blit(screen, "Tienes pedidos activos", self.fs, self.hl, x, y)
+        if has_jobs:
+            blit_left(screen, "Tienes pedidos activos", self.fs, self.hl, x, L["inv_msg"])
         else:
-            y += self._blit(screen, "Sin pedidos", self.fs, (150, 150, 150), x, y)
-        y += self.SEC_GAP + self._div(screen, y)
+            blit_left(screen, "Sin pedidos", self.fs, (150, 150, 150), x, L["inv_msg"])
+        div(screen, L["div_inv"])
 
         # Clima
-        y += self.SEC_GAP
-        y += self._blit(screen, "--- Clima ---", self.fs, self.tx, x, y)
         weather_display = str(weather_condition).replace("_", " ").title()
-        y += self.VR_GAP
-        y += self._blit(screen, f"Condición: {weather_display}", self.fs, self.tx, x, y)
-        y += self._blit(screen, f"Velocidad: {int(speed_multiplier*100)}%", self.fs, self.tx, x, y)
+        blit_fmt(screen, "weather", "Condición: {}", (weather_display,), self.fs, self.tx, x, L["weather"])
+        blit_fmt(
+            screen, "speed", "Velocidad: {}%", (int(speed_multiplier*100),), self.fs, self.tx, x, L["speed"]
+        )
+        y = L["end"]
 
         # --- FOOTER y CARD ---
         bottom = self.rect.bottom - self.PAD
         contextual = None
         if near_pickup:
-            contextual = "🟡 Presiona ESPACIO para recoger"
+            contextual = self._ctx_pickup
         elif near_dropoff:
-            contextual = "🟢 Presiona E para entregar"
+            contextual = self._ctx_dropoff
 
-        est_top = self._draw_footer(
-            screen,
-            x,
-            bottom,
-            contextual,
-            self.fs,
-            self.FOOTER_GAP_LINE,
-            self.FOOTER_SEC_GAP
-        )
-        pygame.draw.rect(
-            screen,
-            self.bg,
-            pygame.Rect(self.rect.left, est_top, self.rect.width, bottom - est_top)
-        )
+        # El footer solo se mide aquí (el fondo ya está limpio); se dibuja una vez en _footer_with_autofit
+        est_top = self._footer_top(x, bottom, contextual, self.fs, self.FOOTER_GAP_LINE, self.FOOTER_SEC_GAP)
 
         # Mostrar card del pedido actual si hay espacio
-        if hasattr(courier, "has_jobs") and courier.has_jobs():
-            job = courier.get_current_job()
-            if job and (est_top - y) > self.CARD_H_MIN + self.SEC_GAP:
-                y += self.SEC_GAP
-                y = self._draw_job_card(screen, x, y, content_w, job, current_game_time=current_game_time)
-                y += self.SEC_GAP
-                y += self._div(screen, y)
+        if job and (est_top - y) > self.CARD_H_MIN + self.SEC_GAP:
+            y += self.SEC_GAP
+            y = self._draw_job_card(screen, x, y, content_w, job, card_tl)
+            y += self.SEC_GAP
+            y += div(screen, y)
 
         top_limit = max(y + 4, self.rect.top + self.PAD + 4)
         self._footer_with_autofit(screen, x, bottom, top_limit, contextual)
+
+        # Guardar el panel compuesto para los frames sin cambios
+        if self._panel is None or self._panel.get_size() != self.rect.size:
+            self._panel = pygame.Surface(self.rect.size)
+        self._panel.blit(screen, (0, 0), self.rect)
+
+    """
+    Resume en una tupla todo lo que la HUD muestra, cuantizado a la precisión visible
+    (segundos enteros, ingresos a 1 decimal, ancho de barra en píxeles y su color, etc.).
+    Los valores de la IA llegan sin cuantizar desde _ai_values y se cuantizan aquí igual que los del jugador
+    ---------Returns---------
+        _frame_state: Devuelve la tupla de estado; si es igual a la del frame anterior, no hace falta redibujar
+    """
+    def _frame_state(self, courier, weather_condition, speed_multiplier, remaining_time, goal_income,
+                     near_pickup, near_dropoff, has_jobs, job, card_tl, ai_vals, max_sta, sta_pct, content_w):
+        card = None
+        if job is not None:
+            card = (job, _priority_level(job), None if card_tl is None else (int(card_tl), card_tl <= 0))
+        ai = None
+        if ai_vals is not None:
+            ai_x, ai_y, ai_w, ai_max_w, ai_jobs, ai_sta, ai_max_sta, ai_pct, ai_rep, ai_inc = ai_vals
+            ai = (
+                ai_x, ai_y, ai_w, ai_max_w, ai_jobs,
+                ai_sta, ai_max_sta, int(content_w * ai_pct), ai_pct < 0.3,
+                ai_rep, round(ai_inc, 1), courier.income >= ai_inc,
+            )
+        return (
+            _mm_ss(remaining_time), remaining_time < 60,
+            round(courier.income, 1), goal_income,
+            courier.x, courier.y, self._get_delivered(courier),
+            int(courier.stamina), max_sta, int(content_w * sta_pct), sta_pct < 0.3,
+            int(self._get_reputation(courier)),
+            weather_condition, int(speed_multiplier*100),
+            near_pickup, near_dropoff, has_jobs, card, ai,
+        )
+
+    """
+    Segundos restantes del pedido actual para la card, o None si no hay pedido, tiempo de juego o deadline
+    """
+    def _card_time_left(self, job, current_game_time):
+        if job is None or current_game_time is None:
+            return None
+        tl = job.get_time_until_deadline(current_game_time)
+        return None if tl == _INF else tl
+
+    """
+    Resuelve una sola vez los accesos opcionales de la IA (inventario, resistencia, reputación, ingresos)
+    ---------Parameters---------
+    ai_courier : Any
+        Objeto courier de la IA
+    ---------Returns---------
+        _bind_ai: Guarda getters del courier IA y de su inventario en la instancia
+        _ai_values: Devuelve la tupla de valores visibles de la IA; la fracción de resistencia y los ingresos
+        van sin cuantizar porque se dibujan con ellos (_frame_state los cuantiza para la clave)
+    """
+    def _bind_ai(self, ai_courier):
+        self._ai_bound = ai_courier
+        inv = getattr(ai_courier, "inventory", None)
+        self._get_ai_max_stamina = attrgetter("max_stamina") if hasattr(ai_courier, "max_stamina") else (lambda c: 100)
+        self._get_ai_reputation = attrgetter("reputation") if hasattr(ai_courier, "reputation") else (lambda c: 70)
+        self._get_ai_income = attrgetter("income") if hasattr(ai_courier, "income") else (lambda c: 0.0)
+        self._get_ai_weight = (lambda: inv.current_weight) if hasattr(inv, "current_weight") else (lambda: 0.0)
+        if hasattr(inv, "max_weight"):
+            self._get_ai_max_weight = lambda: inv.max_weight
+        else:
+            self._get_ai_max_weight = lambda: getattr(ai_courier, "max_weight_ia", 0)
+        if hasattr(inv, "get_job_count"):
+            self._get_ai_jobs = inv.get_job_count
+        elif hasattr(inv, "jobs"):
+            self._get_ai_jobs = lambda: len(inv.jobs)
+        else:
+            self._get_ai_jobs = lambda: 0
+
+    def _ai_values(self, ai_courier):
+        if ai_courier is not self._ai_bound:
+            self._bind_ai(ai_courier)
+        max_sta, pct = _stamina_ratio(ai_courier.stamina, self._get_ai_max_stamina(ai_courier))
+        return (
+            ai_courier.x, ai_courier.y,
+            round(self._get_ai_weight(), 1), self._get_ai_max_weight(), self._get_ai_jobs(),
+            int(ai_courier.stamina), max_sta, pct,
+            int(self._get_ai_reputation(ai_courier)), self._get_ai_income(ai_courier),
+        )
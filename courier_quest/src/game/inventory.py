@@ -1,7 +1,62 @@
 """ 
-from collections import deque es utilizado para manejar el inventario del courier, permitiendo una navegación eficiente y ordenamiento de los trabajos (jobs) en el inventario.
+from operator import attrgetter es para las claves de ordenamiento (evaluadas en C, sin lambdas por elemento)
 """
-from collections import deque
+from operator import attrgetter
+
+_by_id = attrgetter("id")
+_by_priority = attrgetter("priority")
+_by_payout = attrgetter("payout")
+_by_insert_seq = attrgetter("_insert_seq")
+_by_deadline_offset = attrgetter("_deadline_offset")
+
+
+
+"""
+Devuelve una copia de jobs ordenada por (-campo, id) con dos pasadas estables de claves attrgetter,
+sin crear una tupla ni llamar una lambda por job
+"""
+def _sorted_desc_then_id(jobs, field_key):
+    lst = sorted(jobs, key=_by_id)
+    lst.sort(key=field_key, reverse=True)
+    return lst
+
+
+"""
+Devuelve una copia de jobs ordenada (estable) por tiempo restante: las claves se precalculan en una pasada
+(mismo valor que get_time_until_deadline, acotado a 0; sin deadline el offset ya es inf) y se ordenan índices
+"""
+def _sorted_by_deadline(jobs, t):
+    keys = [o - t if o > t else 0.0 for o in map(_by_deadline_offset, jobs)]
+    return [jobs[i] for i in sorted(range(len(jobs)), key=keys.__getitem__)]
+
+
+"""
+Devuelve una copia de jobs ordenada (estable) por distancia Manhattan al dropoff: las distancias se calculan
+en una sola pasada sobre las coordenadas ya desempacadas del Job y se ordenan índices con keys.__getitem__
+"""
+def _sorted_by_distance(jobs, courier_pos):
+    cx, cy = courier_pos
+    keys = [abs(cx - job._dx) + abs(cy - job._dy) for job in jobs]
+    return [jobs[i] for i in sorted(range(len(jobs)), key=keys.__getitem__)]
+
+
+"""
+Ordena lst en sitio según el modo ("priority" | "deadline" | "payout" | "original"); t es el tiempo de juego
+para "deadline". Lo usan apply_sort y add_job (con un orden activo), así insertar y reordenar siempre coinciden.
+Dos pasadas estables equivalen a la clave (-campo, id): primero por id, luego por campo descendente
+"""
+def _sort_jobs(lst, mode, t=None):
+    if mode == "priority":
+        lst.sort(key=_by_id)
+        lst.sort(key=_by_priority, reverse=True)
+    elif mode == "deadline":
+        lst[:] = _sorted_by_deadline(lst, t)
+    elif mode == "payout":
+        lst.sort(key=_by_id)
+        lst.sort(key=_by_payout, reverse=True)
+    elif mode == "original":
+        # add_job marca _insert_seq en todo job que entra al inventario
+        lst.sort(key=_by_insert_seq)
 
 """
 Esta clase Inventory maneja el inventario del courier, permitiendo agregar, eliminar y navegar entre trabajos (jobs).
@@ -12,14 +67,27 @@ class Inventory:
     Maneja el inventario navegable del courier con diferentes vistas
     y permite aplicar ORDENAMIENTO REAL (F1–F4).
     """
+    __slots__ = (
+        "max_weight", "jobs", "current_index", "_current_weight",
+        "_insert_counter", "_last_sort_mode", "_last_sort_time", "_sorted_cache",
+    )
+
     def __init__(self, max_weight):
         self.max_weight = max_weight
-        self.jobs = deque()
+        # Lista simple: la navegación usa índices con %, y apply_sort ordena en sitio con list.sort
+        self.jobs = []
         self.current_index = 0
 
+        # Peso acumulado, se mantiene en add_job / remove_current_job / clear
+        self._current_weight = 0
+
         # Soporte para "orden original" (orden de inserción)
         self._insert_counter = 0
         self._last_sort_mode = None  # "priority" | "deadline" | "payout" | None
+        self._last_sort_time = None  # tiempo de juego del último orden "deadline" (sus claves dependen de él)
+
+        # Vistas ordenadas ya calculadas: vista -> (parámetro, lista). Se vacía en cada mutación
+        self._sorted_cache = {}
 
     # -------------------- helpers --------------------
     """
@@ -29,7 +97,7 @@ class Inventory:
     """
     @property
     def current_weight(self):
-        return sum(job.weight for job in self.jobs)
+        return self._current_weight
 
     @property
     def current_job(self):
@@ -48,10 +116,12 @@ class Inventory:
         if job_obj is None:
             self.current_index = 0
             return
-        try:
-            self.current_index = list(self.jobs).index(job_obj)
-        except ValueError:
-            self.current_index = 0
+        # Búsqueda por identidad (Job no define __eq__)
+        for i, j in enumerate(self.jobs):
+            if j is job_obj:
+                self.current_index = i
+                return
+        self.current_index = 0
 
     # -------------------- mutadores --------------------
     """
@@ -70,11 +140,23 @@ class Inventory:
     def add_job(self, job):
         if self.can_add_job(job):
             # Marcar índice de inserción si no existe (para "orden original")
-            if not hasattr(job, "_insert_seq"):
+            if job._insert_seq < 0:
                 job._insert_seq = self._insert_counter
                 self._insert_counter += 1
 
-            self.jobs.append(job)
+            # Si hay un orden activo (F1–F3), el job queda donde lo pondría apply_sort (mismas claves);
+            # el inventario está limitado por peso, así que reordenar la lista cuesta poco
+            mode = self._last_sort_mode
+            if mode is None:
+                self.jobs.append(job)
+            else:
+                current = self.current_job
+                self.jobs.append(job)
+                _sort_jobs(self.jobs, mode, self._last_sort_time)
+                if current is not None:
+                    self._set_current_to(current)
+            self._current_weight += job.weight
+            self._sorted_cache.clear()
             if len(self.jobs) == 1:
                 self.current_index = 0
             return True
@@ -84,6 +166,8 @@ class Inventory:
         if self.jobs and 0 <= self.current_index < len(self.jobs):
             removed_job = self.jobs[self.current_index]
             del self.jobs[self.current_index]
+            self._current_weight -= removed_job.weight
+            self._sorted_cache.clear()
 
             if not self.jobs:
                 self.current_index = 0
@@ -112,24 +196,27 @@ class Inventory:
     get_jobs_sorted_by_deadline: Ordena por fecha límite (más cercana primero)
     get_jobs_sorted_by_payout: Ordena por pago (mayor a menor)
     get_jobs_sorted_by_distance: Ordena por distancia desde la posición del courier
+
+    Cada vista se guarda hasta la siguiente mutación del inventario (con el mismo parámetro),
+    así consultarla varias veces seguidas no vuelve a ordenar. La lista devuelta es compartida: no modificarla
     """ 
+    def _cached_view(self, name, param, build):
+        cached = self._sorted_cache.get(name)
+        if cached is None or cached[0] != param:
+            cached = self._sorted_cache[name] = (param, build())
+        return cached[1]
+
     def get_jobs_sorted_by_priority(self):
-        return sorted(self.jobs, key=lambda job: (-job.priority, job.id))
+        return self._cached_view("priority", None, lambda: _sorted_desc_then_id(self.jobs, _by_priority))
 
     def get_jobs_sorted_by_deadline(self, current_game_time):
-        return sorted(self.jobs, key=lambda job: (
-            job.get_time_until_deadline(current_game_time)
-            if getattr(job, "deadline", None) else float('inf')
-        ))
+        return self._cached_view("deadline", current_game_time, lambda: _sorted_by_deadline(self.jobs, current_game_time))
 
     def get_jobs_sorted_by_payout(self):
-        return sorted(self.jobs, key=lambda job: (-job.payout, job.id))
+        return self._cached_view("payout", None, lambda: _sorted_desc_then_id(self.jobs, _by_payout))
 
     def get_jobs_sorted_by_distance(self, courier_pos):
-        return sorted(self.jobs, key=lambda job: (
-            abs(courier_pos[0] - job.dropoff_pos[0]) +
-            abs(courier_pos[1] - job.dropoff_pos[1])
-        ))
+        return self._cached_view("distance", tuple(courier_pos), lambda: _sorted_by_distance(self.jobs, courier_pos))
 
     # -------------------- ORDENAMIENTO REAL --------------------
     """ 
@@ -147,34 +234,20 @@ class Inventory:
         if not self.jobs:
             return
 
-        current = self.current_job  # conservar foco
-        lst = list(self.jobs)
-
-        if mode == "priority":
-            lst.sort(key=lambda job: (-job.priority, job.id))
-            self._last_sort_mode = "priority"
-
-        elif mode == "deadline":
-            if current_game_time is None:
-                return
-            def key_deadline(job):
-                if getattr(job, "deadline", None):
-                    return job.get_time_until_deadline(current_game_time)
-                return float('inf')
-            lst.sort(key=key_deadline)
-            self._last_sort_mode = "deadline"
+        if mode == "deadline" and current_game_time is None:
+            return
 
-        elif mode == "payout":
-            lst.sort(key=lambda job: (-job.payout, job.id))
-            self._last_sort_mode = "payout"
+        current = self.current_job  # conservar foco
+        _sort_jobs(self.jobs, mode, current_game_time)
 
+        if mode in ("priority", "deadline", "payout"):
+            self._last_sort_mode = mode
+            self._last_sort_time = current_game_time
         elif mode == "original":
-            lst.sort(key=lambda job: getattr(job, "_insert_seq", 0))
             self._last_sort_mode = None
 
-        # Reescribir la deque y restaurar foco
-        self.jobs.clear()
-        self.jobs.extend(lst)
+        # self.jobs ya quedó ordenada en sitio (los empates de las vistas dependen de ese orden); restaurar foco
+        self._sorted_cache.clear()
         self._set_current_to(current)
 
     # -------------------- utilidades --------------------
@@ -192,4 +265,6 @@ class Inventory:
 
     def clear(self):
         self.jobs.clear()
+        self._sorted_cache.clear()
         self.current_index = 0
+        self._current_weight = 0
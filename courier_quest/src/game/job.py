@@ -1,13 +1,77 @@
 """
 import pygame es utilizado para representar un trabajo (job) en el juego Courier Quest
-from datetime import datetime, timedelta se utiliza para manejar tiempos y fechas, como deadlines y release times
+from datetime import datetime se utiliza para interpretar el deadline ISO de cada pedido
+from functools import lru_cache es para no volver a interpretar el mismo deadline ISO en cada Job
+from bisect import bisect_left es para ubicar el retraso en la tabla de penalizaciones
 """ 
 import pygame
-from datetime import datetime, timedelta
+from datetime import datetime
+from functools import lru_cache
+from bisect import bisect_left
+
+_INF = float('inf')
+
+# Grupos de estados como frozenset: la pertenencia es un solo hash (los literales ya están internados)
+# en lugar de comparar contra cada elemento de una tupla
+_NOT_AVAILABLE_STATES = frozenset(("delivered", "cancelled", "expired", "picked_up"))
+_FINAL_STATES = frozenset(("delivered", "cancelled", "expired"))
+_CANCELLABLE_STATES = frozenset(("available", "pending", "picked_up"))
+_OPEN_STATES = frozenset(("available", "pending"))
+
+# Penalización por entrega tarde: ≤30 s → -2, 31–120 s → -5, >120 s → -10
+_LATE_LIMITS = (30, 120)
+_LATE_DELTAS = (-2, -5, -10)
+
+"""
+Interpreta un deadline ISO ("...Z" o con/sin zona) y devuelve el datetime, o None si no es válido.
+Los pedidos suelen repetir deadlines, así que cada cadena distinta se interpreta una sola vez
+"""
+@lru_cache(maxsize=256)
+def _parse_deadline(deadline_str):
+    try:
+        # Solo se reescribe el sufijo Z (no se recorre toda la cadena)
+        if deadline_str.endswith('Z'):
+            deadline_str = deadline_str[:-1] + '+00:00'
+        return datetime.fromisoformat(deadline_str)
+    except ValueError:
+        return None
+
+"""
+Tabla de reputación por puntualidad como función pura sobre floats (sin datetime ni estado del Job)
+---------Parameters---------
+real_duration : float
+    Segundos reales desde el pickup hasta la entrega
+planned_duration : float
+    Segundos previstos desde el pickup hasta el deadline
+---------Returns---------
+    _reputation_delta: Cambio de reputación (+5, +3, -2, -5, -10), o 0 si el tiempo previsto no es válido
+"""
+def _reputation_delta(real_duration, planned_duration):
+    if planned_duration <= 0:
+        # Si el planned es inválido, no aplicar delta
+        return 0
+
+    # Lateness: negativo si llegó antes, positivo si llegó tarde
+    lateness = real_duration - planned_duration
+
+    if lateness <= -0.20 * planned_duration:
+        return 5  # ≥20% antes
+    if lateness <= 0:
+        return 3  # a tiempo (o levemente antes sin llegar al 20%)
+    return _LATE_DELTAS[bisect_left(_LATE_LIMITS, lateness)]
+
 
 class Job:
     """Representa un pedido individual en el juego"""
 
+    # Sin __dict__ por instancia: hay un Job por pedido y sus atributos se leen cada frame.
+    # _insert_seq lo asigna Inventory.add_job la primera vez que el job entra (orden original); -1 = sin asignar
+    __slots__ = (
+        "id", "pickup_pos", "dropoff_pos", "payout", "weight", "priority", "release_time",
+        "deadline", "state", "pickup_time", "delivery_time", "game_start_time",
+        "_deadline_offset", "_px", "_py", "_dx", "_dy", "_insert_seq", "_rects", "_on_state_change",
+    )
+
     """ 
     Inicializa un trabajo (job) con los datos proporcionados en job_data y la hora de inicio del juego
     Parámetros:
@@ -18,6 +82,9 @@ class Job:
         self.id = job_data.get('id', 'UNKNOWN')
         self.pickup_pos = tuple(job_data.get('pickup', [0, 0]))
         self.dropoff_pos = tuple(job_data.get('dropoff', [0, 0]))
+        # Coordenadas sueltas para los chequeos de cercanía (se consultan cada frame)
+        self._px, self._py = self.pickup_pos
+        self._dx, self._dy = self.dropoff_pos
         self.payout = float(job_data.get('payout', 0))
         self.weight = job_data.get('weight', 0)
         self.priority = job_data.get('priority', 0)
@@ -25,11 +92,7 @@ class Job:
 
         # Deadline absoluto (datetime)
         deadline_str = job_data.get('deadline', '')
-        try:
-            # Acepta "...Z" y sin zona
-            self.deadline = datetime.fromisoformat(deadline_str.replace('Z', '+00:00'))
-        except Exception:
-            self.deadline = None
+        self.deadline = _parse_deadline(deadline_str) if isinstance(deadline_str, str) else None
 
         # Estado inicial: si release_time > 0, arranca 'pending'; si no, 'available'
         self.state = "pending" if self.release_time > 0 else "available"
@@ -38,24 +101,37 @@ class Job:
         self.delivery_time: float | None = None # segundos desde inicio de partida
 
         self.game_start_time = game_start_time
+        self._insert_seq = -1
+        self._rects = None  # (TILE_SIZE, rect pickup, rect dropoff), ver marker_rects
+        # Callback opcional (job, estado anterior, estado nuevo) que se llama en cada cambio de estado;
+        # lo registra quien necesite enterarse (p. ej. JobsManager para sus contadores)
+        self._on_state_change = None
+
+        # Deadline como segundos desde el inicio de partida: los chequeos por frame comparan floats
+        # en lugar de construir datetime/timedelta. Sin deadline (o sin zona comparable) es inf
+        self._deadline_offset = _INF
+        if self.deadline:
+            try:
+                self._deadline_offset = (self.deadline - game_start_time).total_seconds()
+            except TypeError:
+                pass
 
     # ---------- Helpers de tiempo ----------
     """ 
-    _now_dt: Convierte current_game_time (segundos desde inicio) a datetime
     time_until_deadline: Devuelve segundos restantes hasta el deadline (>=0). Si no hay deadline, inf
+    get_time_until_deadline: Alias de time_until_deadline
     """ 
-    def _now_dt(self, current_game_time: float) -> datetime:
-        return self.game_start_time + timedelta(seconds=current_game_time)
-
     def time_until_deadline(self, current_game_time: float) -> float:
         """Segundos restantes hasta el deadline (>=0). Si no hay deadline, inf."""
-        if not self.deadline:
-            return float('inf')
-        left = (self.deadline - self._now_dt(current_game_time)).total_seconds()
-        return max(0.0, left)
+        left = self._deadline_offset - current_game_time
+        return left if left > 0.0 else 0.0
+
+    # Nombre con el que lo usan Inventory (orden por deadline) y la card de la HUD
+    get_time_until_deadline = time_until_deadline
 
     # ---------- Ciclo de vida ----------
     """ 
+    _set_state: Cambia el estado y avisa al callback _on_state_change si hay uno registrado
     is_available: Disponible si pasó su release_time y no está tomada/entregada/cancelada/expirada
     pickup: Marca el pedido como recogido
     deliver: Marca el pedido como entregado (si no expiró)
@@ -65,16 +141,23 @@ class Job:
     is_at_pickup: Verifica si el courier está en el punto de recogida
     is_at_dropoff: Verifica si el courier está en el punto de entrega
     """ 
+    def _set_state(self, new_state: str) -> None:
+        old_state = self.state
+        self.state = new_state
+        callback = self._on_state_change
+        if callback is not None:
+            callback(self, old_state, new_state)
+
     def is_available(self, current_game_time: float) -> bool:
         """Disponible si pasó su release_time y no está tomada/entregada/cancelada/expirada."""
-        if self.state in ("delivered", "cancelled", "expired", "picked_up"):
+        if self.state in _NOT_AVAILABLE_STATES:
             return False
         return current_game_time >= self.release_time
 
     def pickup(self, current_game_time: float) -> bool:
         """Marca el pedido como recogido."""
-        if self.state in ("available",) or (self.state == "pending" and self.is_available(current_game_time)):
-            self.state = "picked_up"
+        if self.state == "available" or (self.state == "pending" and self.is_available(current_game_time)):
+            self._set_state("picked_up")
             self.pickup_time = current_game_time
             return True
         return False
@@ -83,16 +166,16 @@ class Job:
         """Marca el pedido como entregado (si no expiró)."""
         if self.state == "picked_up":
             if self.is_expired(current_game_time):
-                self.state = "expired"
+                self._set_state("expired")
                 return False
-            self.state = "delivered"
+            self._set_state("delivered")
             self.delivery_time = current_game_time
             return True
         return False
 
     def cancel(self) -> bool:
-        if self.state in ("available", "pending", "picked_up"):
-            self.state = "cancelled"
+        if self.state in _CANCELLABLE_STATES:
+            self._set_state("cancelled")
             return True
         return False
 
@@ -101,26 +184,28 @@ class Job:
         Expira si hay deadline y ya pasó, mientras no esté entregado/cancelado.
         (Se chequea también cuando está en 'picked_up'.)
         """
-        if self.state in ("delivered", "cancelled", "expired"):
+        if self.state in _FINAL_STATES:
             return self.state == "expired"
-        if not self.deadline:
-            return False
-        return self._now_dt(current_game_time) > self.deadline
+        return current_game_time > self._deadline_offset
 
+    # Valor absoluto con comparación en línea (sin la búsqueda global + llamada a abs)
     def is_close_to_pickup(self, courier_pos, distance=2):
         cx, cy = courier_pos
-        px, py = self.pickup_pos
-        return (abs(cx - px) <= distance and abs(cy - py) <= distance)
+        ox = cx - self._px
+        oy = cy - self._py
+        return -distance <= ox <= distance and -distance <= oy <= distance
 
     def is_at_pickup(self, courier_pos):
         cx, cy = courier_pos
-        px, py = self.pickup_pos
-        return (abs(cx - px) + abs(cy - py)) <= 1
+        ox = cx - self._px
+        oy = cy - self._py
+        return (ox if ox >= 0 else -ox) + (oy if oy >= 0 else -oy) <= 1
 
     def is_at_dropoff(self, courier_pos):
         cx, cy = courier_pos
-        dx, dy = self.dropoff_pos
-        return (abs(cx - dx) + abs(cy - dy)) <= 1
+        ox = cx - self._dx
+        oy = cy - self._dy
+        return (ox if ox >= 0 else -ox) + (oy if oy >= 0 else -oy) <= 1
 
     # ---------- Reputación por puntualidad ----------
     """ 
@@ -148,27 +233,8 @@ class Job:
         if self.state != "delivered" or self.delivery_time is None or self.pickup_time is None or not self.deadline:
             return 0
 
-        # Duración real (seg) desde pickup hasta entrega
-        real_duration = self.delivery_time - self.pickup_time
-
-        # Tiempo previsto (seg) desde pickup hasta deadline
-        planned_duration = (self.deadline - (self.game_start_time + timedelta(seconds=self.pickup_time))).total_seconds()
-        if planned_duration <= 0:
-            # Si el planned es inválido, no aplicar delta
-            return 0
-
-        # Lateness: negativo si llegó antes, positivo si llegó tarde
-        lateness = real_duration - planned_duration
-
-        if lateness <= -0.20 * planned_duration:
-            return 5  # ≥20% antes
-        if lateness <= 0:
-            return 3  # a tiempo (o levemente antes sin llegar al 20%)
-        if lateness <= 30:
-            return -2
-        if lateness <= 120:
-            return -5
-        return -10
+        # Duración real y prevista (seg) desde pickup hasta entrega / deadline
+        return _reputation_delta(self.delivery_time - self.pickup_time, self._deadline_offset - self.pickup_time)
 
     # ---------- Marcadores (visual) ----------
     """ 
@@ -177,15 +243,24 @@ class Job:
     - Si está "picked_up", dibuja un rectángulo verde en la posición de entrega (dropoff)
     - Si está "available" o "pending" y el courier está cerca del punto de recogida (pickup), dibuja un rectángulo amarillo en la posición de recogida (pickup)
 
+    marker_rects: Devuelve (rect pickup, rect dropoff) en píxeles; se crean una vez por tamaño de tile
     __str__: Devuelve una representación en cadena del trabajo, mostrando su id, estado, pago y peso
     """ 
     def draw_markers(self, screen, TILE_SIZE, courier_pos):
         if self.state == "picked_up":
-            rx, ry = self.dropoff_pos
-            pygame.draw.rect(screen, (0, 255, 0), pygame.Rect(rx * TILE_SIZE, ry * TILE_SIZE, TILE_SIZE, TILE_SIZE), 2)
-        elif (self.state in ("available", "pending") and self.is_close_to_pickup(courier_pos)):
-            px, py = self.pickup_pos
-            pygame.draw.rect(screen, (255, 255, 0), pygame.Rect(px * TILE_SIZE, py * TILE_SIZE, TILE_SIZE, TILE_SIZE), 2)
+            pygame.draw.rect(screen, (0, 255, 0), self.marker_rects(TILE_SIZE)[1], 2)
+        elif (self.state in _OPEN_STATES and self.is_close_to_pickup(courier_pos)):
+            pygame.draw.rect(screen, (255, 255, 0), self.marker_rects(TILE_SIZE)[0], 2)
+
+    def marker_rects(self, TILE_SIZE):
+        rects = self._rects
+        if rects is None or rects[0] != TILE_SIZE:
+            rects = self._rects = (
+                TILE_SIZE,
+                pygame.Rect(self._px * TILE_SIZE, self._py * TILE_SIZE, TILE_SIZE, TILE_SIZE),
+                pygame.Rect(self._dx * TILE_SIZE, self._dy * TILE_SIZE, TILE_SIZE, TILE_SIZE),
+            )
+        return rects[1], rects[2]
 
     def __str__(self):
         return f"Job {self.id} - {self.state} - ${self.payout} - {self.weight}kg"
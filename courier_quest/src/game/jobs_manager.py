@@ -1,16 +1,30 @@
 """ 
 import pygame es para representar un gestor de trabajos (jobs) en el juego Courier Quest
+import logging es para los mensajes de carga/generación de pedidos (el detalle por pedido va a DEBUG)
 import random es para generar trabajos aleatorios
+from collections import Counter es para llevar la cantidad de jobs en cada estado sin recorrer all_jobs
+import heapq es para las colas de eventos (liberación y expiración) ordenadas por tiempo
+from bisect import insort es para insertar un job liberado en available_jobs respetando el orden de all_jobs
 from datetime import datetime, timedelta es para manejar tiempos y fechas, como deadlines y release times
 from .job import Job importa la clase Job del módulo job
 from .inventory import Inventory importa la clase Inventory del módulo inventory
 """ 
 import pygame
+import logging
 import random
+import heapq
+from collections import Counter
+from bisect import insort
 from datetime import datetime, timedelta
 from .job import Job
 from .inventory import Inventory
 
+logger = logging.getLogger(__name__)
+
+# Estados desde los que un job puede expirar / ser liberado (frozenset: un solo hash por prueba)
+_EXPIRABLE_STATES = frozenset(("pending", "available", "picked_up"))
+_RELEASABLE_STATES = frozenset(("pending", "available"))
+
 
 class JobsManager:
     """
@@ -21,11 +35,16 @@ class JobsManager:
       - Recogida/entrega y transición de estados
       - Estadísticas y utilidades de dibujo
     """
+    # Lado (en tiles) de las celdas del índice espacial de pickups disponibles
+    PICKUP_CELL = 4
+
     def __init__(self, jobs_data: dict, game_start_time: datetime | None = None):
         self.game_start_time = game_start_time or datetime.now()
         self.all_jobs: list[Job] = self._load_jobs(jobs_data)
         self.available_jobs: list[Job] = []
         self.completed_jobs: list[Job] = []
+        self._marker_cache = None  # (TILE_SIZE, surf pickup, surf dropoff), ver _marker_surfaces
+        self._reset_events()
 
     # ----------------------- CARGA -----------------------
     """ 
@@ -37,42 +56,135 @@ class JobsManager:
             try:
                 jobs.append(Job(job_data, self.game_start_time))
             except Exception as e:
-                print(f"Job inválido saltado: {e}")
+                logger.warning("Job inválido saltado: %s", e)
         return jobs
 
     # --------------------- CICLO JUEGO -------------------
     """ 
+    _reset_events: Reconstruye las colas de eventos a partir de all_jobs (al cargar o generar pedidos)
     update: Refresca la disponibilidad y expiración de trabajos según el tiempo actual
+    _on_job_state_change: Callback que cada job llama al cambiar de estado; mantiene los contadores por estado
+    y el registro de jobs en curso ('picked_up')
+    _cell_of: Devuelve la celda del índice espacial que contiene el pickup del job
+    _remove_available: Saca un job de available_jobs, de su índice por id y del índice espacial
+
+    Los pedidos solo cambian de estado al cruzar su release_time o su deadline, así que en lugar de
+    recorrer all_jobs en cada frame se guardan dos heaps (release, orden, job) y (deadline, orden, job):
+    update solo saca los eventos cuyo tiempo ya pasó y descarta los de jobs que cambiaron de estado
     """ 
+    def _reset_events(self) -> None:
+        self._order = {j: i for i, j in enumerate(self.all_jobs)}
+        self._release_heap = [(j.release_time, i, j) for i, j in enumerate(self.all_jobs)]
+        self._expiry_heap = [
+            (j._deadline_offset, i, j) for i, j in enumerate(self.all_jobs)
+            if j._deadline_offset != float('inf')
+        ]
+        heapq.heapify(self._release_heap)
+        heapq.heapify(self._expiry_heap)
+
+        # Contadores por estado: se ajustan en _on_job_state_change, que cada job llama al cambiar de estado
+        self._state_counts = Counter(j.state for j in self.all_jobs)
+        # Jobs en 'picked_up' (dict usado como conjunto ordenado), también se mantiene en _on_job_state_change;
+        # así draw_job_markers no recorre all_jobs para encontrar los 0-2 dropoffs en curso
+        self._picked_up: dict[Job, None] = {j: None for j in self.all_jobs if j.state == "picked_up"}
+        for j in self.all_jobs:
+            j._on_state_change = self._on_job_state_change
+        self.available_jobs = []
+        # Índice id -> jobs de available_jobs con ese id, en el orden de la lista (se mantiene junto con ella).
+        # Es una lista porque los ids no son únicos: sin id todos quedan en 'UNKNOWN' y un archivo puede repetirlos
+        self._available_ids: dict[str, list[Job]] = {}
+        self._nearby_cache = None  # ((x, y, distancia), jobs), se invalida al cambiar available_jobs
+        self._last_update_time = None  # tiempo del último update(); con él try_pickup_job evita repetir is_expired
+        # Índice espacial: celda (px // PICKUP_CELL, py // PICKUP_CELL) -> jobs disponibles con pickup en ella
+        self._pickup_cells: dict[tuple[int, int], list[Job]] = {}
+
     def update(self, current_game_time: float, courier_pos: tuple[int, int]) -> None:
         """
         Refresca:
           - cuáles están disponibles (release_time cumplido)
           - cuáles han expirado (deadline)
         """
-        # 1) Liberar jobs cuyo release_time ya pasó y aún no fueron tomados
-        self.available_jobs = [
-            j for j in self.all_jobs
-            if j.state in ("pending", "available") and j.is_available(current_game_time)
-               and not j.is_expired(current_game_time)
-        ]
-        for j in self.available_jobs:
-            if j.state == "pending":
-                j.state = "available"
+        heappop = heapq.heappop
+        available_ids = self._available_ids
 
-        # 2) Marcar expirados (incluye los en inventario)
-        for j in self.all_jobs:
-            if j.state in ("pending", "available", "picked_up") and j.is_expired(current_game_time):
-                j.state = "expired"
-                if j in self.available_jobs:
-                    self.available_jobs.remove(j)
+        # 1) Marcar expirados (incluye los en inventario)
+        expiry = self._expiry_heap
+        while expiry and current_game_time > expiry[0][0]:
+            j = heappop(expiry)[2]
+            state = j.state
+            if state in _EXPIRABLE_STATES:
+                if state == "available" and j in available_ids.get(j.id, ()):
+                    self._remove_available(j)
+                j._set_state("expired")
+
+        # 2) Liberar jobs cuyo release_time ya pasó y aún no fueron tomados (en el orden de all_jobs)
+        release = self._release_heap
+        if release and current_game_time >= release[0][0]:
+            available = self.available_jobs
+            order_key = self._order.__getitem__
+            cells = self._pickup_cells
+            while release and current_game_time >= release[0][0]:
+                j = heappop(release)[2]
+                if j.state in _RELEASABLE_STATES:
+                    j._set_state("available")
+                    insort(available, j, key=order_key)
+                    insort(available_ids.setdefault(j.id, []), j, key=order_key)
+                    cells.setdefault(self._cell_of(j), []).append(j)
+                    self._nearby_cache = None
+
+        self._last_update_time = current_game_time
+
+    def _on_job_state_change(self, job: Job, old_state: str, new_state: str) -> None:
+        counts = self._state_counts
+        counts[old_state] -= 1
+        counts[new_state] += 1
+        if new_state == "picked_up":
+            self._picked_up[job] = None
+        elif old_state == "picked_up":
+            self._picked_up.pop(job, None)
+
+    def _cell_of(self, job: Job) -> tuple[int, int]:
+        return (job._px // self.PICKUP_CELL, job._py // self.PICKUP_CELL)
+
+    def _remove_available(self, job: Job) -> None:
+        self.available_jobs.remove(job)
+        same_id = self._available_ids[job.id]
+        same_id.remove(job)
+        if not same_id:
+            del self._available_ids[job.id]
+        cell = self._cell_of(job)
+        bucket = self._pickup_cells[cell]
+        bucket.remove(job)
+        if not bucket:
+            del self._pickup_cells[cell]
+        self._nearby_cache = None
 
     # -------------------- BÚSQUEDAS ----------------------
     """ 
     get_available_jobs_nearby: Devuelve trabajos disponibles cerca de la posición del courier
+
+    El resultado se reutiliza mientras el courier siga en la misma casilla y available_jobs no cambie.
+    Solo se prueban los jobs de las celdas del índice espacial que tocan la ventana de búsqueda
+    (la misma prueba que Job.is_close_to_pickup, en línea) y se devuelven en el orden de available_jobs
     """ 
     def get_available_jobs_nearby(self, courier_pos: tuple[int, int], max_distance: int = 3) -> list:
-        return [j for j in self.available_jobs if j.is_close_to_pickup(courier_pos, max_distance)]
+        key = (courier_pos[0], courier_pos[1], max_distance)
+        cached = self._nearby_cache
+        if cached is not None and cached[0] == key:
+            return cached[1]
+        cx, cy, d = key
+        cell = self.PICKUP_CELL
+        cells = self._pickup_cells
+        nearby = []
+        for bx in range((cx - d) // cell, (cx + d) // cell + 1):
+            for by in range((cy - d) // cell, (cy + d) // cell + 1):
+                bucket = cells.get((bx, by))
+                if bucket:
+                    nearby.extend(j for j in bucket if -d <= j._px - cx <= d and -d <= j._py - cy <= d)
+        if len(nearby) > 1:
+            nearby.sort(key=self._order.__getitem__)
+        self._nearby_cache = (key, nearby)
+        return nearby
 
     # ----------------- Recoger / Entregar ----------------
     """ 
@@ -85,20 +197,21 @@ class JobsManager:
         inventory: Inventory,
         current_game_time: float
     ) -> bool:
-        for job in list(self.available_jobs):
-            if job.id != job_id:
-                continue
+        # Solo se recorren los jobs disponibles con ese id (normalmente uno) en lugar de todo available_jobs;
+        # no hace falta copiar: después de cada _remove_available se sale del ciclo
+        for job in self._available_ids.get(job_id, ()):
             if not job.is_at_pickup(courier_pos):
                 continue
-            if job.is_expired(current_game_time):
-                job.state = "expired"
-                self.available_jobs.remove(job)
+            # Si update() ya corrió con este mismo tiempo, todo lo que sigue en available_jobs está vigente
+            if current_game_time != self._last_update_time and job.is_expired(current_game_time):
+                job._set_state("expired")
+                self._remove_available(job)
                 return False
             if not inventory.can_add_job(job):
                 return False
             if job.pickup(current_game_time):
                 inventory.add_job(job)
-                self.available_jobs.remove(job)
+                self._remove_available(job)
                 return True
         return False
 
@@ -119,7 +232,7 @@ class JobsManager:
             return None
 
         if current_job.is_expired(current_game_time):
-            current_job.state = "expired"
+            current_job._set_state("expired")
             inventory.remove_current_job()
             return None
 
@@ -138,25 +251,39 @@ class JobsManager:
     Luego, para cada trabajo:
     - Si está "picked_up", dibuja un rectángulo verde en la posición de entrega (dropoff)
     - Si está "available" o "pending" y el courier está cerca del punto de recogida (pickup), dibuja un rectángulo amarillo en la posición de recogida (pickup)
+
+    _marker_surfaces: Devuelve las Surfaces con el contorno amarillo (pickup) y verde (dropoff) para un tamaño de tile
     """ 
     def draw_job_markers(self, screen, TILE_SIZE: int, courier_pos: tuple[int, int]) -> None:
+        # Los Rect en píxeles se crean una vez por job (Job.marker_rects) y los contornos se
+        # dibujan una vez por tamaño de tile; todos los marcadores salen en un solo blits()
+        pickup_surf, dropoff_surf = self._marker_surfaces(TILE_SIZE)
+        blits = []
+        append = blits.append
+        marker_rects = Job.marker_rects
+
         # Pickups disponibles (amarillo)
         for job in self.available_jobs:
             if job.state == "available":
-                px, py = job.pickup_pos
-                pygame.draw.rect(
-                    screen, (255, 255, 0),
-                    pygame.Rect(px * TILE_SIZE, py * TILE_SIZE, TILE_SIZE, TILE_SIZE), 2
-                )
+                append((pickup_surf, marker_rects(job, TILE_SIZE)[0]))
 
         # Dropoffs en curso (verde)
-        for job in self.all_jobs:
-            if job.state == "picked_up":
-                dx, dy = job.dropoff_pos
-                pygame.draw.rect(
-                    screen, (0, 255, 0),
-                    pygame.Rect(dx * TILE_SIZE, dy * TILE_SIZE, TILE_SIZE, TILE_SIZE), 2
-                )
+        for job in self._picked_up:
+            append((dropoff_surf, marker_rects(job, TILE_SIZE)[1]))
+
+        if blits:
+            screen.blits(blits, doreturn=False)
+
+    def _marker_surfaces(self, TILE_SIZE: int):
+        cached = self._marker_cache
+        if cached is None or cached[0] != TILE_SIZE:
+            surfs = []
+            for col in ((255, 255, 0), (0, 255, 0)):
+                surf = pygame.Surface((TILE_SIZE, TILE_SIZE), pygame.SRCALPHA)
+                pygame.draw.rect(surf, col, surf.get_rect(), 2)
+                surfs.append(surf)
+            cached = self._marker_cache = (TILE_SIZE, surfs[0], surfs[1])
+        return cached[1], cached[2]
 
     # ---------------------- ESTADOS ----------------------
     """ 
@@ -164,17 +291,13 @@ class JobsManager:
     get_available_jobs_count: Devuelve la cantidad de trabajos disponibles actualmente
     """ 
     def get_stats(self) -> dict:
-        total = len(self.all_jobs)
-        available = len(self.available_jobs)
-        completed = sum(1 for j in self.all_jobs if j.state == "delivered")
-        in_progress = sum(1 for j in self.all_jobs if j.state == "picked_up")
-        expired = sum(1 for j in self.all_jobs if j.state == "expired")
+        counts = self._state_counts
         return {
-            "total": total,
-            "available": available,
-            "completed": completed,
-            "in_progress": in_progress,
-            "expired": expired,
+            "total": len(self.all_jobs),
+            "available": len(self.available_jobs),
+            "completed": counts["delivered"],
+            "in_progress": counts["picked_up"],
+            "expired": counts["expired"],
         }
 
     def get_available_jobs_count(self) -> int:
@@ -196,46 +319,62 @@ class JobsManager:
     Finalmente, agrega el trabajo generado a self.all_jobs
     """ 
     def generate_random_jobs(self, world, num_jobs: int = 15) -> None:
+        # Cada consulta recorre todo el mapa: las calles solo se piden si hacen falta como fallback
         building_edges = world.get_building_edges()
-        street_positions = world.get_street_positions()
 
         if not building_edges:
-            print("No hay bordes de edificios; usando calles como fallback.")
-            building_edges = street_positions
+            logger.warning("No hay bordes de edificios; usando calles como fallback.")
+            building_edges = world.get_street_positions()
 
         if not building_edges:
-            print("No hay posiciones válidas para generar pedidos.")
+            logger.warning("No hay posiciones válidas para generar pedidos.")
             return
 
         self.all_jobs.clear()
 
         actual_num = min(num_jobs, max(0, len(building_edges) - 1))
         if actual_num < num_jobs:
-            print(f"Reduciendo pedidos a {actual_num} (posiciones limitadas).")
+            logger.warning("Reduciendo pedidos a %d (posiciones limitadas).", actual_num)
+
+        n_edges = len(building_edges)
+        # Todos los sorteos se hacen en lote (una llamada a random.choices por campo) y el ciclo solo indexa.
+        # Dropoff uniforme entre las demás posiciones sin armar la lista de candidatas:
+        # se sortea un índice entre n-1 y se salta el del pickup
+        k = actual_num
+        pick_idxs = random.choices(range(n_edges), k=k)
+        drop_idxs = random.choices(range(n_edges - 1), k=k)
+        deadlines_s = random.choices(range(180, 421), k=k)
+        payouts = random.choices(range(120, 401), k=k)
+        weights = random.choices((1, 2, 3), k=k)
+        priorities = random.choices((0, 1, 2), k=k)
 
         for i in range(actual_num):
-            pickup_pos = random.choice(building_edges)
-            drop_candidates = [p for p in building_edges if p != pickup_pos]
-            if not drop_candidates:
+            pick_idx = pick_idxs[i]
+            drop_idx = drop_idxs[i]
+            if drop_idx >= pick_idx:
+                drop_idx += 1
+            pickup_pos = building_edges[pick_idx]
+            dropoff_pos = building_edges[drop_idx]
+            if dropoff_pos == pickup_pos:
                 continue
-            dropoff_pos = random.choice(drop_candidates)
 
             release_time = 0  # disponibles desde el comienzo
-            deadline_dt = self.game_start_time + timedelta(seconds=random.randint(180, 420))
+            deadline_dt = self.game_start_time + timedelta(seconds=deadlines_s[i])
 
             job_data = {
                 "id": f"PED-{i + 1:03d}",
-                "pickup": list(pickup_pos),
-                "dropoff": list(dropoff_pos),
-                "payout": random.randint(120, 400),
+                "pickup": pickup_pos,   # Job ya lo convierte con tuple()
+                "dropoff": dropoff_pos,
+                "payout": payouts[i],
                 "deadline": deadline_dt.isoformat(),
-                "weight": random.randint(1, 3),
-                "priority": random.randint(0, 2),
+                "weight": weights[i],
+                "priority": priorities[i],
                 "release_time": release_time,
             }
 
             job = Job(job_data, self.game_start_time)
             self.all_jobs.append(job)
-            print(f"  {job.id}: {pickup_pos} -> {dropoff_pos} | deadline {deadline_dt.time()}")
+            logger.debug("  %s: %s -> %s | deadline %s", job.id, pickup_pos, dropoff_pos, deadline_dt.time())
 
-        print(f"Generados {len(self.all_jobs)} pedidos.")
+        self._reset_events()
+        logger.info("Generados %d pedidos.", len(self.all_jobs))
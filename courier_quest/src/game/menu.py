@@ -3,13 +3,25 @@
 import pygame es necesario para el menú gráfico
 from game.ai_courier import AIDifficulty es necesario para manejar la dificultad de la IA
 from game.score_board import load_scores es necesario para cargar las puntuaciones guardadas
+from functools import lru_cache es para compartir las fuentes del sistema entre instancias del menú
 """ 
 import pygame
+from functools import lru_cache
 
 from game.ai_courier import AIDifficulty
 from game.score_board import load_scores
 
 
+"""
+Busca y carga una fuente del sistema una sola vez por (nombre, tamaño, negrita);
+main.py crea un Menu nuevo al volver de cada partida y así no se vuelve a escanear
+el directorio de fuentes
+"""
+@lru_cache(maxsize=8)
+def _load_sysfont(name, size, bold=False):
+    return pygame.font.SysFont(name, size, bold=bold)
+
+
 # ==================== MENÚ PRINCIPAL ====================
 
 class Menu:
@@ -32,13 +44,29 @@ class Menu:
         self.screen = screen
         self.width, self.height = screen.get_size()
         pygame.font.init()
-        self.title_font = pygame.font.SysFont("arial", 64, bold=True)
-        self.button_font = pygame.font.SysFont("arial", 32, bold=True)
-        self.small_font = pygame.font.SysFont("arial", 20, bold=False)
+        self.title_font = _load_sysfont("arial", 64, bold=True)
+        self.button_font = _load_sysfont("arial", 32, bold=True)
+        self.small_font = _load_sysfont("arial", 20, bold=False)
 
         self.buttons = []
         self._build_buttons()
 
+        # El título no cambia: se renderiza una sola vez
+        self._title_surface = self.title_font.render("Courier Quest II", True, (0, 0, 0))
+        self._title_rect = self._title_surface.get_rect(center=(self.width // 2, 120))
+
+        # Texto del botón de dificultad por nivel, se llena bajo demanda
+        self._diff_cache = {}
+
+        # Fondo pre-compuesto (gris + título + botones en estado normal).
+        # Depende del texto de dificultad, así que se reconstruye si cambia.
+        self._bg = pygame.Surface((self.width, self.height)).convert()
+        self._bg_difficulty = None
+
+        # Estado del mouse seguido por eventos dentro de show()
+        self._mouse_pos = (0, 0)
+        self._mouse_down = False
+
     """ 
     Construye los botones del menú con sus posiciones y acciones
     """ 
@@ -62,7 +90,67 @@ class Menu:
             x = center_x - button_width // 2
             y = start_y + i * (button_height + margin)
             rect = pygame.Rect(x, y, button_width, button_height)
-            self.buttons.append({"rect": rect, "label": label, "action": action})
+            # Base por tipo de botón (rojo para salir, gris para otros) y sus variantes
+            base = (200, 0, 0) if action == "exit" else (60, 60, 60)
+            colors = {
+                "normal": base,
+                "hover": tuple(min(c + 40, 255) for c in base),
+                "pressed": tuple(max(c - 40, 0) for c in base),
+            }
+            btn = {"rect": rect, "label": label, "action": action, "colors": colors}
+            # El texto de los botones fijos se renderiza una sola vez;
+            # el de dificultad depende del nivel y se cachea en _diff_cache
+            if action != "toggle_difficulty":
+                text_surf = self.button_font.render(label, True, (255, 255, 255))
+                btn["text_surf"] = text_surf
+                btn["text_rect"] = text_surf.get_rect(center=rect.center)
+            self.buttons.append(btn)
+
+    """ 
+    Devuelve (superficie, rect) del texto del botón de dificultad para el nivel dado,
+    renderizándolo solo la primera vez que se pide ese nivel
+    """ 
+    def _difficulty_label(self, difficulty: AIDifficulty, rect):
+        cached = self._diff_cache.get(difficulty)
+        if cached is None:
+            text = f"Dificultad IA: {self._difficulty_to_text(difficulty)}"
+            text_surf = self.button_font.render(text, True, (255, 255, 255))
+            cached = (text_surf, text_surf.get_rect(center=rect.center))
+            self._diff_cache[difficulty] = cached
+        return cached
+
+    """ 
+    _draw_button: Dibuja un botón (rectángulo + texto centrado) con el color dado
+    _background: Devuelve el fondo pre-compuesto para la dificultad dada,
+    rehaciéndolo solo cuando cambia la dificultad mostrada
+    """ 
+    def _draw_button(self, surface, btn, color, difficulty: AIDifficulty):
+        rect = btn["rect"]
+        pygame.draw.rect(surface, color, rect, border_radius=6)
+        if btn["action"] == "toggle_difficulty":
+            text_surf, text_rect = self._difficulty_label(difficulty, rect)
+        else:
+            text_surf, text_rect = btn["text_surf"], btn["text_rect"]
+        surface.blit(text_surf, text_rect)
+
+    def _background(self, difficulty: AIDifficulty):
+        if self._bg_difficulty != difficulty:
+            bg = self._bg
+            bg.fill((200, 200, 200))
+            bg.blit(self._title_surface, self._title_rect)
+            for btn in self.buttons:
+                self._draw_button(bg, btn, btn["colors"]["normal"], difficulty)
+            self._bg_difficulty = difficulty
+        return self._bg
+
+    """ 
+    _sync_mouse: Lee de SDL la posición del mouse y si el botón izquierdo está presionado.
+    Solo se usa al entrar al bucle (o al volver de otra pantalla); después el estado se
+    actualiza con los eventos MOUSEMOTION / MOUSEBUTTONDOWN / MOUSEBUTTONUP
+    """ 
+    def _sync_mouse(self):
+        self._mouse_pos = pygame.mouse.get_pos()
+        self._mouse_down = pygame.mouse.get_pressed()[0]
 
     """ 
     Se les pone @staticmethod porque no usan self
@@ -118,16 +206,23 @@ class Menu:
         offset = 0           # índice de inicio visible
         max_visible = 10     # cuántas filas mostrar a la vez
 
+        # Superficie con el contenido ya dibujado; dirty indica que hay que rehacerla
+        self._scores_surface = pygame.Surface((self.width, self.height)).convert()
+        dirty = True
+
         """ 
         Bucle principal de la pantalla de puntuaciones
         Maneja eventos de teclado para desplazarse y volver al menú
         """ 
         running_scores = True
         while running_scores:
+            exposed = False
             for event in pygame.event.get():
                 if event.type == pygame.QUIT:
                     # Cerrar juego completamente
                     return True
+                if event.type == pygame.WINDOWEXPOSED:
+                    exposed = True
                 if event.type == pygame.KEYDOWN:
                     if event.key == pygame.K_ESCAPE:
                         # Volver al menú principal
@@ -135,106 +230,125 @@ class Menu:
                     elif event.key == pygame.K_UP:
                         if offset > 0:
                             offset -= 1
+                            dirty = True
                     elif event.key == pygame.K_DOWN:
                         if offset + max_visible < len(scores):
                             offset += 1
-
-            # Fondo
-            self.screen.fill((30, 30, 30))
-
-            # Título
-            title_surface = self.title_font.render("Puntuaciones", True, (255, 255, 255))
-            title_rect = title_surface.get_rect(center=(self.width // 2, 80))
-            self.screen.blit(title_surface, title_rect)
-
-            # Subtítulo / instrucciones
-            info_text = "ESC: volver | ↑/↓: desplazarse" if scores else "ESC: volver"
-            info_surface = self.small_font.render(info_text, True, (200, 200, 200))
-            info_rect = info_surface.get_rect(center=(self.width // 2, 130))
-            self.screen.blit(info_surface, info_rect)
-
-            # Cabecera de columnas
-            header_y = 180
-            header_x = 120
-            headers = ["#", "Score", "Ingresos", "Tiempo (s)", "Reputación", "Fecha"]
-            col_widths = [40, 100, 120, 130, 120, 240]
-
-            x = header_x
-            for i, h in enumerate(headers):
-                h_surf = self.small_font.render(h, True, (220, 220, 220))
-                self.screen.blit(h_surf, (x, header_y))
-                x += col_widths[i]
-
-            # Línea separadora
-            pygame.draw.line(
-                self.screen,
-                (120, 120, 120),
-                (header_x, header_y + 24),
-                (header_x + sum(col_widths), header_y + 24),
-                1,
-            )
-
-            # Contenido
-            list_y_start = header_y + 36
-
-            if not scores:
-                # Mensaje si no hay puntajes aún
-                msg_surface = self.small_font.render("No hay puntuaciones guardadas todavía.", True, (200, 200, 200))
-                msg_rect = msg_surface.get_rect(center=(self.width // 2, list_y_start + 40))
-                self.screen.blit(msg_surface, msg_rect)
+                            dirty = True
+
+            # Rehacer el contenido solo si cambió el desplazamiento y mostrarlo
+            # solo si cambió o si el sistema pidió repintar la ventana
+            if dirty:
+                self._render_scores(scores, offset, max_visible)
+            if dirty or exposed:
+                self.screen.blit(self._scores_surface, (0, 0))
+                pygame.display.flip()
+                dirty = False
+                clock.tick(60)
             else:
-                # Mostrar sólo el segmento visible
-                visible_scores = scores[offset: offset + max_visible]
-                row_y = list_y_start
-
-                for idx, entry in enumerate(visible_scores, start=offset + 1):
-                    score = entry.get("score", 0.0)
-                    income = entry.get("income", 0.0)
-                    time_s = entry.get("time", 0.0)
-                    rep = entry.get("reputation", 0)
-                    ts = self._format_timestamp(entry.get("timestamp", ""))
-
-                    # Color alternado de filas
-                    if idx % 2 == 0:
-                        row_bg = (40, 40, 40)
-                    else:
-                        row_bg = (50, 50, 50)
-                    pygame.draw.rect(
-                        self.screen,
-                        row_bg,
-                        pygame.Rect(header_x - 10, row_y - 4, sum(col_widths) + 20, 28),
-                    )
-
-                    # Preparar cada columna
-                    values = [
-                        str(idx),
-                        f"{score:.2f}",
-                        f"{income:.2f}",
-                        f"{time_s:.1f}",
-                        str(rep),
-                        ts,
-                    ]
-
-                    x = header_x
-                    for i, val in enumerate(values):
-                        v_surf = self.small_font.render(val, True, (230, 230, 230))
-                        self.screen.blit(v_surf, (x, row_y))
-                        x += col_widths[i]
-
-                    row_y += 30  # siguiente fila
-
-                # Indicador de página / offset
-                page_info = f"{offset + 1}-{min(offset + max_visible, len(scores))} de {len(scores)}"
-                page_surf = self.small_font.render(page_info, True, (200, 200, 200))
-                page_rect = page_surf.get_rect(center=(self.width // 2, self.height - 40))
-                self.screen.blit(page_surf, page_rect)
-
-            pygame.display.flip()
-            clock.tick(60)
+                clock.tick(30)
 
         # Volver al menú sin cerrar el juego
         return False
 
+    """ 
+    _render_scores: Dibuja en self._scores_surface la pantalla completa de puntuaciones
+    (fondo, título, cabecera, filas visibles e indicador de página) para el offset dado.
+    Solo se llama cuando cambia el offset, no en cada frame
+    """ 
+    def _render_scores(self, scores, offset: int, max_visible: int):
+        surf = self._scores_surface
+
+        # Fondo
+        surf.fill((30, 30, 30))
+
+        # Título
+        title_surface = self.title_font.render("Puntuaciones", True, (255, 255, 255))
+        title_rect = title_surface.get_rect(center=(self.width // 2, 80))
+        surf.blit(title_surface, title_rect)
+
+        # Subtítulo / instrucciones
+        info_text = "ESC: volver | ↑/↓: desplazarse" if scores else "ESC: volver"
+        info_surface = self.small_font.render(info_text, True, (200, 200, 200))
+        info_rect = info_surface.get_rect(center=(self.width // 2, 130))
+        surf.blit(info_surface, info_rect)
+
+        # Cabecera de columnas
+        header_y = 180
+        header_x = 120
+        headers = ["#", "Score", "Ingresos", "Tiempo (s)", "Reputación", "Fecha"]
+        col_widths = [40, 100, 120, 130, 120, 240]
+
+        x = header_x
+        for i, h in enumerate(headers):
+            h_surf = self.small_font.render(h, True, (220, 220, 220))
+            surf.blit(h_surf, (x, header_y))
+            x += col_widths[i]
+
+        # Línea separadora
+        pygame.draw.line(
+            surf,
+            (120, 120, 120),
+            (header_x, header_y + 24),
+            (header_x + sum(col_widths), header_y + 24),
+            1,
+        )
+
+        # Contenido
+        list_y_start = header_y + 36
+
+        if not scores:
+            # Mensaje si no hay puntajes aún
+            msg_surface = self.small_font.render("No hay puntuaciones guardadas todavía.", True, (200, 200, 200))
+            msg_rect = msg_surface.get_rect(center=(self.width // 2, list_y_start + 40))
+            surf.blit(msg_surface, msg_rect)
+        else:
+            # Mostrar sólo el segmento visible
+            visible_scores = scores[offset: offset + max_visible]
+            row_y = list_y_start
+
+            for idx, entry in enumerate(visible_scores, start=offset + 1):
+                score = entry.get("score", 0.0)
+                income = entry.get("income", 0.0)
+                time_s = entry.get("time", 0.0)
+                rep = entry.get("reputation", 0)
+                ts = self._format_timestamp(entry.get("timestamp", ""))
+
+                # Color alternado de filas
+                if idx % 2 == 0:
+                    row_bg = (40, 40, 40)
+                else:
+                    row_bg = (50, 50, 50)
+                pygame.draw.rect(
+                    surf,
+                    row_bg,
+                    pygame.Rect(header_x - 10, row_y - 4, sum(col_widths) + 20, 28),
+                )
+
+                # Preparar cada columna
+                values = [
+                    str(idx),
+                    f"{score:.2f}",
+                    f"{income:.2f}",
+                    f"{time_s:.1f}",
+                    str(rep),
+                    ts,
+                ]
+
+                x = header_x
+                for i, val in enumerate(values):
+                    v_surf = self.small_font.render(val, True, (230, 230, 230))
+                    surf.blit(v_surf, (x, row_y))
+                    x += col_widths[i]
+
+                row_y += 30  # siguiente fila
+
+            # Indicador de página / offset
+            page_info = f"{offset + 1}-{min(offset + max_visible, len(scores))} de {len(scores)}"
+            page_surf = self.small_font.render(page_info, True, (200, 200, 200))
+            page_rect = page_surf.get_rect(center=(self.width // 2, self.height - 40))
+            surf.blit(page_surf, page_rect)
+
     # ---------- LOOP PRINCIPAL DEL MENÚ ----------
     """ 
     show: Bucle del menú
@@ -244,6 +358,8 @@ class Menu:
     luego entra en un bucle donde maneja eventos:
     - QUIT: devuelve "exit"
     - Clic en botón: dependiendo del botón, cambia dificultad, entra a puntuaciones o devuelve la acción
+    Solo se redibuja cuando cambia lo que se ve (dificultad, botón bajo el mouse o clic);
+    si nada cambió se espera al siguiente frame sin dibujar ni hacer flip
     """ 
 
     def show(self, current_difficulty: AIDifficulty):
@@ -255,11 +371,27 @@ class Menu:
         running = True
         difficulty = current_difficulty
 
+        # Lo que se dibujó en el último flip; None obliga a redibujar
+        last_view = None
+
+        # Estado del mouse: se consulta una vez al entrar y luego se sigue con eventos
+        self._sync_mouse()
+
         while running:
             for event in pygame.event.get():
                 if event.type == pygame.QUIT:
                     return "exit", difficulty
+                if event.type == pygame.WINDOWEXPOSED:
+                    # La ventana se volvió a mostrar: hay que repintarla
+                    last_view = None
+                if event.type == pygame.MOUSEMOTION:
+                    self._mouse_pos = event.pos
+                elif event.type == pygame.MOUSEBUTTONUP and event.button == 1:
+                    self._mouse_pos = event.pos
+                    self._mouse_down = False
                 if event.type == pygame.MOUSEBUTTONDOWN and event.button == 1:
+                    self._mouse_pos = event.pos
+                    self._mouse_down = True
                     mx, my = event.pos
                     for btn in self.buttons:
                         if btn["rect"].collidepoint(mx, my):
@@ -270,71 +402,43 @@ class Menu:
                                 quit_game = self._scores_screen()
                                 if quit_game:
                                     return "exit", difficulty
-                                # Si no se cerró la ventana, simplemente seguimos en el menú
+                                # Si no se cerró la ventana, seguimos en el menú (tapado por las puntuaciones);
+                                # los eventos del mouse se consumieron allá, así que se vuelve a consultar
+                                last_view = None
+                                self._sync_mouse()
                             else:
                                 return btn["action"], difficulty
 
-            # Fondo gris
-            self.screen.fill((200, 200, 200))
-
-            # Título
-            title_surface = self.title_font.render("Courier Quest II", True, (0, 0, 0))
-            title_rect = title_surface.get_rect(center=(self.width // 2, 120))
-            self.screen.blit(title_surface, title_rect)
-
             # -------- ESTADO DEL MOUSE PARA HOVER / CLICK VISUAL --------
             """ 
-            Primero obtiene la posición del mouse y si el botón izquierdo está presionado
-            Luego itera sobre los botones para dibujarlos:
-            - Determina el color base según el tipo de botón (rojo para salir, gris para otros)
-            - Cambia el color si está en hover o presionado
-            - Dibuja el rectángulo del botón
-            - Dibuja el texto del botón centrado
+            Toma la posición del mouse y si el botón izquierdo está presionado (seguidos por eventos)
+            Luego busca el botón bajo el mouse (como mucho uno); si la vista no cambió
+            respecto al último frame dibujado no se hace nada más
             """ 
-            mouse_pos = pygame.mouse.get_pos()
-            mouse_pressed = pygame.mouse.get_pressed()[0]  # True si botón izquierdo está presionado
+            mouse_pos = self._mouse_pos
+            mouse_pressed = self._mouse_down  # True si botón izquierdo está presionado
 
-            # Botones
+            hovered = None
             for btn in self.buttons:
-                rect = btn["rect"]
+                if btn["rect"].collidepoint(mouse_pos):
+                    hovered = btn
+                    break
 
-                # Base por tipo de botón
-                if btn["action"] == "exit":
-                    base_color = (200, 0, 0)
-                else:
-                    base_color = (60, 60, 60)
-
-                # Hover / pressed
-                is_hover = rect.collidepoint(mouse_pos)
-                is_pressed = is_hover and mouse_pressed
-
-                if is_pressed:
-                    color = (
-                        max(base_color[0] - 40, 0),
-                        max(base_color[1] - 40, 0),
-                        max(base_color[2] - 40, 0),
-                    )
-                elif is_hover:
-                    color = (
-                        min(base_color[0] + 40, 255),
-                        min(base_color[1] + 40, 255),
-                        min(base_color[2] + 40, 255),
-                    )
-                else:
-                    color = base_color
+            view = (difficulty, None if hovered is None else hovered["action"], hovered is not None and mouse_pressed)
+            if view == last_view:
+                clock.tick(30)
+                continue
 
-                pygame.draw.rect(self.screen, color, rect, border_radius=6)
-
-                if btn["action"] == "toggle_difficulty":
-                    text = f"Dificultad IA: {self._difficulty_to_text(difficulty)}"
-                else:
-                    text = btn["label"]
+            # Fondo gris, título y botones en estado normal (pre-compuestos)
+            self.screen.blit(self._background(difficulty), (0, 0))
 
-                text_surf = self.button_font.render(text, True, (255, 255, 255))
-                text_rect = text_surf.get_rect(center=rect.center)
-                self.screen.blit(text_surf, text_rect)
+            # Solo el botón bajo el mouse se redibuja con su color de hover o presionado
+            if hovered is not None:
+                state = "pressed" if mouse_pressed else "hover"
+                self._draw_button(self.screen, hovered, hovered["colors"][state], difficulty)
 
             pygame.display.flip()
+            last_view = view
             clock.tick(60)
 
         return None, difficulty
@@ -1,11 +1,11 @@
 # courier_quest/src/game/notifications.py
 """ 
 import pygame para manejar gráficos y renderizado
-from fataclasses import dataclass para definir clases de datos simples
+from fataclasses import dataclass, field para definir clases de datos simples
 from typing import List, Tuple para anotaciones de tipos, especialmente listas y tuplas
 """ 
 import pygame
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from typing import List, Tuple
 
 """ es un @dataclass que representa una notificación tipo 'toast' """ 
@@ -16,6 +16,8 @@ class Toast:
     ttl: float            # segundos restantes
     max_ttl: float        # duración total (para calcular alpha)
     icon: str | None = None  # opcional: emoji/char
+    # Texto ya renderizado (icono + mensaje); texto, color e icono no cambian durante la vida del toast
+    surf: pygame.Surface | None = field(default=None, repr=False, compare=False)
 
 class NotificationsOverlay:
     """
@@ -88,8 +90,8 @@ class NotificationsOverlay:
         Primero calcula la posición de inicio (x_right, y) basada en el rectángulo del panel
         Luego itera sobre las notificaciones en orden inverso (de más reciente a más antigua)
         Para cada notificación:
-        - Compone el texto con el icono si existe
-        - Renderiza el texto y calcula el tamaño de la tarjeta con padding
+        - Compone y renderiza el texto con el icono si existe (solo la primera vez, queda en toast.surf)
+        - Calcula el tamaño de la tarjeta con padding
         - Calcula el alpha basado en el TTL restante para el efecto de fade out
         - Dibuja la tarjeta de fondo con alpha
         """
@@ -101,11 +103,15 @@ class NotificationsOverlay:
 
         # Se dibujan de más reciente a más antigua (arriba → abajo)
         for toast in reversed(self.toasts):
-            # Componer texto (icono + mensaje)
-            txt = f"{toast.icon} {toast.text}" if toast.icon else toast.text
-
-            # Render de texto y tarjeta con padding
-            text_surf, text_rect = self._render_line(txt, toast.color)
+            # Componer y renderizar el texto (icono + mensaje) solo la primera vez que se dibuja el toast
+            text_surf = toast.surf
+            if text_surf is None:
+                txt = f"{toast.icon} {toast.text}" if toast.icon else toast.text
+                text_surf, _ = self._render_line(txt, toast.color)
+                toast.surf = text_surf
+            text_rect = text_surf.get_rect()
+
+            # Tarjeta con padding
             card_w = min(self.max_width, text_rect.width + 2 * self.card_pad)
             card_h = text_rect.height + 2 * self.card_pad
 